@@ -41,16 +41,18 @@ from __future__ import unicode_literals
 
 import re
 import os
+import copy
 import uuid
 import socket
+import functools
+import ipaddress
 import tempfile
 import logging
 import sys
-import io
-from threading import Thread
-import socket
+from threading import Lock, Thread
 
 from netmiko import ConnectHandler, redispatch
+from netmiko.channel import SSHChannel
 from napalm.base.base import NetworkDriver
 from napalm.base.exceptions import (
     ReplaceConfigException,
@@ -59,12 +61,11 @@ from napalm.base.exceptions import (
     CommandErrorException,
 )
 
-from netaddr import IPAddress, IPNetwork
 import napalm.base.helpers
-from napalm.base.helpers import textfsm_extractor
+import napalm.base.exceptions
 
 import time
-import tftpy
+import textfsm
 
 
 # Easier to store these as constants
@@ -87,13 +88,110 @@ IPV6_ADDR_REGEX = "(?:{}|{}|{})".format(IPV6_ADDR_REGEX_1, IPV6_ADDR_REGEX_2, IP
 
 MAC_REGEX = r"[a-fA-F0-9]{4}\.[a-fA-F0-9]{4}\.[a-fA-F0-9]{4}"
 VLAN_REGEX = r"\d{1,4}"
-RE_IPADDR = re.compile(r"{}".format(IP_ADDR_REGEX))
+RE_IPADDR = re.compile(IP_ADDR_REGEX)
 RE_IPADDR_STRIP = re.compile(r"({})\n".format(IP_ADDR_REGEX))
-RE_MAC = re.compile(r"{}".format(MAC_REGEX))
+RE_MAC = re.compile(MAC_REGEX)
+
+# Sent by is_alive to keep the connection alive
+NULL_BYTE = "\x00"
 
 # Period needed for 32-bit AS Numbers
 ASN_REGEX = r"[\d\.]+"
 
+# Compiled patterns used when parsing command output
+RE_VERSION_SYSTEM = re.compile(r"^(System|Chassis):\s+(.*)\s+\(Serial #:\s+(\S+),(.*)")
+RE_VERSION_IRONWARE = re.compile(r"^IronWare : Version\s+(\S+)\s+Copyright \(c\)\s+(.*)")
+RE_UPTIME = re.compile(r"\s+Active MP(.*)Uptime\s+(\d+)\s+days\s+(\d+)\s+hours\s+(\d+)\s+minutes\s+(\d+)\s+seconds")
+RE_SPEED = re.compile(r"^(?P<number>\d+)(?P<unit>\S+)$")
+SPEED_UNIT_MULTIPLIER = {"M": 1, "Mbit": 1, "G": 1000, "Gbit": 1000}
+# Convert lbX/loopbackX to LoopbackX, tnX/gre-tnlX to TunnelX and veX to VeX
+INTERFACE_NAME_PREFIXES = {"lb": "Loopback", "loopback": "Loopback", "tn": "Tunnel", "gre-tnl": "Tunnel", "ve": "Ve"}
+RE_INTERFACE_NAME = re.compile(r"^(?:(?P<prefix>lb|loopback|tn|gre-tnl|ve)(?P<index>\d+)$|.*(?P<ifnum>\d+/\d+))")
+RE_INTERFACE_NUMBER = re.compile(r".*(\d+/\d+)")
+RE_INTERFACE_SLOT_PORT = re.compile(r"(\d+)/(\d+)$")
+RE_SHOW_INTERFACE_ETHERNET_PORT = re.compile(r"^(\S*(?i:ethernet)\S*) is (?:up|down|disabled|empty)", re.M)
+RE_PORT_RANGE = re.compile(r"(\d+/)(\d+)(?:\s+to\s+(\d+/)(\d+))?")
+RE_BGP_ROUTE_NONE = re.compile(r"None of the BGP4 routes match the display condition", re.MULTILINE)
+RE_BGP_ROUTE = re.compile(
+    r"^(?P<index>\d+)\s+(?P<prefix>\S+)\s+(?P<next_hop>\S+)"
+    r"\s+(?P<med>\d+)\s+(?P<local_pref>\d+)\s+(?P<weight>\d+)\s+(?P<status>\S+)"
+)
+RE_BGP_ROUTE_V6_FIRST_LINE = re.compile(r"^(?P<index>\d+)\s+(?P<prefix>\S+)\s+(?P<next_hop>\S+)")
+RE_BGP_AS_PATH = re.compile(r"^\s*AS_PATH:\s+(?P<path>.*)")
+RE_BGP_LAST_UPDATE = re.compile(r"^\s+Last update.*table:\s+(?P<last_update>\S+),\s+(?P<paths>\d+)\s+")
+RE_BGP_SUMMARY_ROUTER_ID = re.compile(
+    r"^\s+Router ID:\s+(?P<router_id>{})\s+Local AS Number:\s+(?P<local_as>{})".format(IPV4_ADDR_REGEX, ASN_REGEX),
+    re.MULTILINE,
+)
+# The uptime may contain spaces so it is matched lazily up to the four counters that end the row, rather than
+# greedily to the end of the line and then backtracking over every whitespace run
+RE_BGP_SUMMARY_PEER = re.compile(
+    r"^\s+(?P<remote_addr>{}|{})\s+(?P<remote_as>{})\s+(?P<state>\S+)\s+"
+    r"(?P<uptime>.+?)"
+    r"\s\s+(?P<accepted_prefixes>\d+)"
+    r"\s+(?P<filtered_prefixes>\d+)"
+    r"\s+(?P<sent_prefixes>\d+)"
+    r"\s+(?P<tosend_prefixes>\d+)\s*$".format(IPV4_ADDR_REGEX, IPV6_ADDR_REGEX, ASN_REGEX)
+)
+RE_BGP_SUMMARY_PEER_OVERFLOW = re.compile(
+    r"^\s+(?P<remote_addr>{}|{})\s+(?P<remote_as>{})\s+(?P<state>\S+)\s+"
+    r"(?P<uptime>.+)\s".format(IPV4_ADDR_REGEX, IPV6_ADDR_REGEX, ASN_REGEX)
+)
+RE_BGP_NEIGHBOR = re.compile(
+    r"^\d+\s+IP Address:\s+(?P<remote_addr>\S+),"
+    r"\s+AS:\s+(?P<remote_as>{})"
+    r"\s+\((?:IBGP|EBGP)\), RouterID:\s+(?P<remote_id>{}),"
+    r"\s+VRF:\s+(?P<vrf_name>\S+)".format(ASN_REGEX, IPV4_ADDR_REGEX)
+)
+RE_BGP_NEIGHBOR_DESCRIPTION = re.compile(r"\s+Description:\s+(.*)")
+RE_BGP_NEIGHBOR_STATE = re.compile(r"\s+State:\s+(\S+),\s+Time:\s+(\S+),\s+KeepAliveTime:\s+(\d+),\s+HoldTime:\s+(\d+)")
+RE_BGP_ROUTES_NEIGHBOR = re.compile(r"IP Address:\s*(?P<remote_addr>[\d.:a-fA-F]+)")
+RE_STATISTICS_COUNTER = re.compile(
+    r"\s+In(?P<counter>Octets|UnicastPkts|BroadcastPkts|MulticastPkts|Errors|Discards)\s+(?P<rx>\d+)"
+    r"\s+Out(?P=counter)\s+(?P<tx>\d+)"
+)
+# show statistics counter name to the rx and tx keys of get_interfaces_counters
+STATISTICS_COUNTER_KEYS = {
+    "Octets": ("rx_octets", "tx_octets"),
+    "UnicastPkts": ("rx_unicast_packets", "tx_unicast_packets"),
+    "BroadcastPkts": ("rx_broadcast_packets", "tx_broadcast_packets"),
+    "MulticastPkts": ("rx_multicast_packets", "tx_multicast_packets"),
+    "Errors": ("rx_errors", "tx_errors"),
+    "Discards": ("rx_discards", "tx_discards"),
+}
+# show arp entry: number, IP address, MAC address, type, age and port
+RE_ARP_ENTRY = re.compile(
+    r"^\d\S*[^\S\n]+(?P<ip>\S+)[^\S\n]+(?P<mac>\S+)[^\S\n]+(?:Dynamic|Static)[^\S\n]+(?P<age>\S+)"
+    r"[^\S\n]+(?P<interface>\S+)[^\S\n]*$",
+    re.M,
+)
+# show mac-address rows are "MAC Port Age VLAN" on MLX and have an extra ESI column on CER
+RE_MAC_TABLE_ENTRY_MLX = re.compile(
+    r"^(?P<mac>\S+)[^\S\n]+(?P<port>\S+)[^\S\n]+(?P<age>Static|\d+)[^\S\n]+(?P<vlan>\d+)[^\S\n]*$", re.M
+)
+RE_MAC_TABLE_ENTRY_CER = re.compile(
+    r"^(?P<mac>\S+)[^\S\n]+(?P<port>\S+)[^\S\n]+(?P<age>Static|\d+)[^\S\n]+(?P<vlan>\d+)[^\S\n]+(?P<esi>\S+)[^\S\n]*$",
+    re.M,
+)
+RE_PING_PROBES = re.compile(r"\((\d*)/(\d*)\)")
+RE_PING_MIN_AVG_MAX = re.compile(r"(\d*)/(\d*)/(\d*)")
+RE_PING_REPLY = re.compile(r"^Reply from .* time=(\d+)")
+# traceroute hop line: hop, three "<rtt> ms" probes, the host and optionally its [address]
+RE_TRACEROUTE_HOP = re.compile(
+    r"^[^\S\n]+(?P<hop>[0-9]{1,3})"
+    r"[^\S\n]+(?P<p1>\S+)[^\S\n]+\S+[^\S\n]+(?P<p2>\S+)[^\S\n]+\S+[^\S\n]+(?P<p3>\S+)[^\S\n]+\S+"
+    r"[^\S\n]+(?P<host>\S+)(?:[^\S\n]+\[?(?P<ip_address>[^\s\[\]]+)\]?)?[^\S\n]*$",
+    re.M,
+)
+RE_IPV6_NEIGHBORS_HEADER = re.compile(r"^IPv6\s+Address.*Interface$", re.M | re.I)
+RE_IPV6_NEIGHBOR_ENTRY = re.compile(
+    r"^[^\S\n]*(\S+)[^\S\n]+([\d.]+)[^\S\n]+(\S+)[^\S\n]+(\S+)[^\S\n]+(\S+)[^\S\n]*$", re.M
+)
+# Lines of the running config that "show run | include snmp-server" would return
+RE_SNMP_SERVER = re.compile(r"^[ \t]*snmp-server[ \t]+(\S+)(.*)$", re.M)
+# Status lines removed from the output of every command by _send_command_postprocess
+RE_COMMAND_OUTPUT_NOISE = re.compile(r"^(?:Load for five secs|Time source is ).*$", re.M)
+
 """
 Per netiron 5.9 docs:
 maxttl value parameter is the maximum TTL (hops) value: Possible value is 1 - 255. The default is 30 seconds.
@@ -126,11 +224,418 @@ PING_SIZE = 16
 PING_COUNT = 1
 PING_VRF = ""
 
+# Seconds the merge candidate TFTP server waits on its sockets. This is also the longest commit_config waits for
+# the server to notice it has been stopped.
+TFTP_SERVER_TIMEOUT = 1
+# Seconds to wait for a whole configuration to be displayed, as long as send_command_timing allowed
+CONFIG_READ_TIMEOUT = 120
+
 
 SUPPORTED_ROUTING_PROTOCOLS = ["bgp"]
 
+# Command output cached on the driver, keyed by the attribute it is stored in
+CACHED_SHOW_COMMANDS = {
+    "show_int": "show interface",
+    "show_int_brief_wide": "show int brief wide",
+    "show_vlan": "show vlan",
+    "show_running_config_lag": "show running-config lag",
+    "show_mpls_config": "show mpls config",
+    "show_mpls_interface_brief": "show mpls interface brief",
+    "show_running_config": "show running-config",
+    "show_running_config_interface": "show running-config interface",
+}
+
+# get_route_to route and protocol_attributes fields that are the same for every BGP route, in output order
+BGP_ROUTE_TEMPLATE = {
+    "protocol": None,
+    "inactive_reason": "n/a",
+    "age": 0,
+    "routing_table": "default",
+    "next_hop": None,
+    "outgoing_interface": None,
+    "preference": 0,
+    "current_active": False,
+    "selected_next_hop": False,
+    "protocol_attributes": None,
+}
+BGP_ROUTE_ATTRIBUTES_TEMPLATE = {
+    "local_preference": None,
+    "remote_as": "n/a",
+    "communities": None,
+    "preference2": 0,
+    "metric": 0,
+    "weight": 0,
+    "status": None,
+    "local_as": 22822,
+    "as_path": None,
+    "remote_address": None,
+}
+
+# get_lags interface fields that are the same for every LAG, in output order
+LAG_INTERFACE_TEMPLATE = {
+    "is_up": True,
+    "is_enabled": True,
+    "description": None,
+    "last_flapped": float(-1),
+    "speed": float(0),
+    "mac_address": "",
+    "mtu": 0,
+    "children": None,
+}
+
 logger = logging.getLogger(__name__)
 
+# Checked once at import; get_interfaces drops its extra keys under the unit tests
+IN_PYTEST = "pytest" in sys.modules
+
+TEXTFSM_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "utils", "textfsm_templates")
+
+# Compiled TextFSM templates and their lowercased headers keyed by template name. A TextFSM object holds
+# parser state so the lock serialises its use between driver instances running in different threads.
+TEXTFSM_TEMPLATES = {}
+TEXTFSM_LOCK = Lock()
+
+
+def textfsm_extractor(cls, template_name, raw_text):
+    """Apply a TextFSM template to raw_text and return the matching table.
+
+    Drop-in replacement for napalm.base.helpers.textfsm_extractor that reads and compiles each template
+    only once instead of on every call.
+    """
+    with TEXTFSM_LOCK:
+        template = TEXTFSM_TEMPLATES.get(template_name)
+        if template is None:
+            template_path = os.path.join(TEXTFSM_TEMPLATE_DIR, "{}.tpl".format(template_name))
+            try:
+                with open(template_path) as f:
+                    fsm = textfsm.TextFSM(f)
+            except IOError:
+                raise napalm.base.exceptions.TemplateNotImplemented(
+                    "TextFSM template {}.tpl is not defined under {}".format(template_name, TEXTFSM_TEMPLATE_DIR)
+                )
+            except textfsm.TextFSMTemplateError as e:
+                raise napalm.base.exceptions.TemplateRenderException(
+                    "Wrong format of TextFSM template {}: {}".format(template_name, e)
+                )
+            template = TEXTFSM_TEMPLATES[template_name] = (fsm, [h.lower() for h in fsm.header])
+
+        fsm, header = template
+        fsm.Reset()
+        return [dict(zip(header, row)) for row in fsm.ParseText(raw_text)]
+
+
+def cached_output_scope(func):
+    """Decorate a driver method that reads cached command output.
+
+    With cache_show_output off the cache only lives for the outermost decorated call, so output fetched while
+    one getter runs is reused within it but never by the next getter.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self._cache_enabled:
+            return func(self, *args, **kwargs)
+
+        if self._cache_scope_depth == 0:
+            self._clear_cached_output()
+        self._cache_scope_depth += 1
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self._cache_scope_depth -= 1
+            if self._cache_scope_depth == 0:
+                self._clear_cached_output()
+
+    return wrapper
+
+
+def iter_lines(text):
+    """Yield the lines of text one at a time, like str.splitlines() but without building the list."""
+    start = 0
+    end = text.find("\n")
+    while end != -1:
+        yield text[start:end].rstrip("\r")
+        start = end + 1
+        end = text.find("\n", start)
+    if start < len(text):
+        yield text[start:].rstrip("\r")
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_ip_address(address):
+    """Return ipaddress.ip_address(address), reusing the object for addresses seen before."""
+    return ipaddress.ip_address(address)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_mac_address(mac):
+    """Return napalm.base.helpers.mac(mac), reusing the result for MAC addresses seen before."""
+    return napalm.base.helpers.mac(mac)
+
+
+def parse_route_counters(line):
+    """Return the values of a 'Name:value, Name:value, ...' routes-summary line as ints, or None if one isn't."""
+    try:
+        return [int(field.partition(":")[2]) for field in line.split(",")]
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def bgp_route_status(status):
+    """Return (protocol, preference, active) for a BGP route status code such as BE or I."""
+    if "E" in status:
+        return "eBGP", 20, "B" in status
+    return "iBGP", 200, "B" in status
+
+
+# Regex equivalents of the show_interface and show_interface_brief_wide templates, used instead of TextFSM
+# for these large outputs. [^\S\n] stands in for \s so that, like TextFSM, every rule matches within one line.
+RE_FAST_SHOW_INTERFACE = re.compile(
+    r"^(?:(?P<port>\S+) is (?P<link>up|down|disabled|empty)"
+    r"|[^\S\n]+Configured.*speed.*actual (?P<speed>\S+),"
+    r"|[^\S\n]+Hardware.*address is .*(?:bia (?P<mac>[\da-f:\.]*))"
+    r"|.*port is in (?P<tag>tagged|untagged|dual) mode, port state is (?P<portstate>\S+)"
+    r"|[^\S\n]+Port name is (?P<name>.*)"
+    r"|.*MTU (?P<mtu>\d+))",
+    re.M,
+)
+RE_FAST_SHOW_INTERFACE_BRIEF_WIDE = re.compile(
+    r"^(?P<port>\S+)[^\S\n]+(?P<link>Up|Down|Disabled|Empty)[^\S\n]+(?P<portstate>\S+)[^\S\n]+(?P<speed>\S+)"
+    r"[^\S\n]+(?P<tag>Yes|No|N/A)[^\S\n]+(?P<mac>\S+)[^\S\n]+(?P<name>.*)",
+    re.M,
+)
+
+
+def parse_show_interface(raw_text):
+    """Parse show interface output into the same table as the show_interface template."""
+    result = []
+    fields = ("port", "link", "portstate", "speed", "tag", "name", "mtu", "mac")
+    record = {}
+    for m in RE_FAST_SHOW_INTERFACE.finditer(raw_text):
+        record.update((k, v) for k, v in m.groupdict().items() if v is not None)
+        if m.group("mtu") is not None:
+            if record.get("port"):
+                result.append({f: record.get(f, "") for f in fields})
+            record = {}
+
+    # TextFSM records whatever is left at the end of the output
+    if record.get("port"):
+        result.append({f: record.get(f, "") for f in fields})
+
+    return result
+
+
+def parse_show_interface_brief_wide(raw_text):
+    """Parse show int brief wide output into the same table as the show_interface_brief_wide template."""
+    return [m.groupdict() for m in RE_FAST_SHOW_INTERFACE_BRIEF_WIDE.finditer(raw_text)]
+
+
+RE_FAST_SHOW_RUNNING_CONFIG_INTERFACE = re.compile(
+    r"^(?:interface (?P<interface>\S+) (?P<interfacenum>\S+)"
+    r"|[^\S\n]+vrf forwarding (?P<vrfname>\S+)"
+    r"|[^\S\n]+ip address (?P<ipv4address>\S+)"
+    r"|[^\S\n]+ipv6 address (?P<ipv6address>\S+)"
+    r"|[^\S\n]+ip access-group (?P<interfaceacl>\S+) in"
+    r"|(?P<end>!))",
+    re.M,
+)
+
+
+def parse_show_running_config_interface(raw_text):
+    """Yield the show_running_config_interface template records one at a time, without building the table."""
+    interface = interfacenum = ""
+    for m in RE_FAST_SHOW_RUNNING_CONFIG_INTERFACE.finditer(raw_text):
+        if m.group("end"):
+            interface = interfacenum = ""
+        elif m.group("interface"):
+            interface, interfacenum = m.group("interface", "interfacenum")
+        else:
+            record = {"interface": interface, "interfacenum": interfacenum}
+            for field in ("vrfname", "ipv4address", "ipv6address", "interfaceacl"):
+                record[field] = m.group(field) or ""
+            yield record
+
+
+RE_FAST_BGP_DETAIL = re.compile(
+    r"^(?:\d+[^\S\n]+IP Address: (?P<remote_address>\S+), AS: (?P<remote_as>\d+) \((IBGP|EBGP)\), "
+    r"RouterID: (?P<router_id>\S+), VRF: (?P<routing_table>\S+)"
+    r"|[^\S\n]+Description: (?P<description>.*)"
+    r"|[^\S\n]+State: (?P<connection_state>\S+), Time: (?P<uptime>.*), KeepAliveTime: (?P<keepalive>\d+), "
+    r"HoldTime: (?P<holdtime>\d+)"
+    r"|[^\S\n]+PeerGroup: (?P<peer_group>\S+)"
+    r"|[^\S\n]+UpdateSource: (?P<update_source>.*)"
+    r"|[^\S\n]+NextHopSelf: (?P<next_hop_self>\S+)"
+    r"|[^\S\n]+RemovePrivateAs:[^\S\n]+:[^\S\n]+(?P<remove_private_as>\S+)"
+    r"|[^\S\n]+Address Family[^\S\n]*: (?P<address_family>\S+) .*"
+    r"|[^\S\n]+SendCommunity: (?P<send_community>\S+)"
+    r"|[^\S\n]+SendExtendedCommunity: (?P<send_extended_community>\S+)"
+    r"|[^\S\n]+Route-map: (?P<route_map>.*)"
+    r"|[^\S\n]+Prefix-list: (?P<prefix_list>.*)"
+    r"|[^\S\n]+Filter-list: (?P<filter_list>.*)"
+    r"|[^\S\n]+Last Connection Reset Reason:(?P<previous_connection_state>\S+)"
+    r"|[^\S\n]+Multihop-EBGP: (?P<multihop>\d+)"
+    r"|[^\S\n]+Local host:[^\S\n]+(?P<local_address>\S+), Local[^\S\n]+Port: (?P<local_port>\d+)"
+    r"|.*, Remote Port: (?P<remote_port>\d+)"
+    r"|(?P<record>[^\S\n]+SendQue: .*|Error: .*))",
+    re.M,
+)
+BGP_DETAIL_FIELDS = (
+    "uptime",
+    "update_source",
+    "next_hop_self",
+    "address_family",
+    "send_community",
+    "send_extended_community",
+    "route_map",
+    "prefix_list",
+    "filter_list",
+    "description",
+    "peer_group",
+    "routing_table",
+    "connection_state",
+    "previous_connection_state",
+    "multihop",
+    "remove_private_as",
+    "remote_as",
+    "local_as",
+    "router_id",
+    "local_address",
+    "local_port",
+    "remote_address",
+    "remote_port",
+    "holdtime",
+    "keepalive",
+)
+# Per-neighbor route counters read from show ip[v6] bgp neighbors routes-summary, -1 when not reported
+BGP_ROUTE_STATS_FIELDS = (
+    "received_prefixes",
+    "accepted_prefixes",
+    "filtered_prefixes",
+    "sent_prefixes",
+    "to_send_prefixes",
+)
+# bgp_detail policy fields and the name they are reported under as import_<name> / export_<name>
+BGP_DETAIL_POLICY_FIELDS = (("route_map", "policy"), ("filter_list", "filter_list"), ("prefix_list", "prefix_list"))
+# get_bgp_neighbors_detail fields converted to int
+BGP_DETAIL_INT_FIELDS = (
+    "local_as",
+    "remote_as",
+    "local_port",
+    "remote_port",
+    "input_messages",
+    "output_messages",
+    "input_updates",
+    "output_updates",
+    "messages_queued_out",
+    "holdtime",
+    "configured_holdtime",
+    "keepalive",
+    "configured_keepalive",
+    "advertised_prefix_count",
+    "received_prefix_count",
+)
+
+
+def parse_bgp_detail(raw_text):
+    """Parse show ip[v6] bgp neighbors output into the same table as the bgp_detail template."""
+    result = []
+    record = {}
+    for m in RE_FAST_BGP_DETAIL.finditer(raw_text):
+        if m.group("record") is not None:
+            if record:
+                result.append({f: record.get(f, "") for f in BGP_DETAIL_FIELDS})
+            record = {}
+        else:
+            record.update((k, v) for k, v in m.groupdict().items() if v is not None)
+
+    # TextFSM records whatever is left at the end of the output
+    if record:
+        result.append({f: record.get(f, "") for f in BGP_DETAIL_FIELDS})
+
+    return result
+
+
+def append_bgp_detail(bgp_dict, peer_info):
+    """Add a get_bgp_neighbors_detail peer to bgp_dict under its VRF and remote AS."""
+    remote_as = peer_info["remote_as"]
+    vrf_name = peer_info["routing_table"]
+
+    if vrf_name not in bgp_dict.keys():
+        bgp_dict[vrf_name] = {}
+    if remote_as not in bgp_dict[vrf_name].keys():
+        bgp_dict[vrf_name][remote_as] = []
+
+    bgp_dict[vrf_name][remote_as].append(peer_info)
+
+
+def finalize_bgp_detail(item, summary_peers, afi):
+    """Convert a parsed bgp_detail record into a get_bgp_neighbors_detail peer, merged with its summary data."""
+    # Determining a few other fields in the final peer_info
+    item["up"] = item["connection_state"] == "ESTABLISHED"
+    item["local_address_configured"] = bool(item["local_address"])
+    item["multihop"] = item["multihop"] == "yes"
+    item["remove_private_as"] = item["remove_private_as"] == "yes"
+
+    # TODO: The below fields need to be retrieved
+    # Currently defaulting their values to False or 0
+    item["multipath"] = False
+    item["suppress_4byte_as"] = False
+    item["local_as_prepend"] = False
+    item["flap_count"] = 0
+    item["active_prefix_count"] = 0
+    item["suppressed_prefix_count"] = 0
+
+    # Merge the local AS and prefix counts from the summary, keyed by the same normalized address
+    _bgp_summary = summary_peers.get(str(parse_ip_address(item["remote_address"])))
+    if _bgp_summary:
+        item["local_as"] = _bgp_summary["local_as"]
+
+        _afi_info = _bgp_summary["address_family"].get(afi)
+        if _afi_info:
+            item["suppressed_prefix_count"] = _afi_info.get("filtered_prefixes", 0)
+            item["advertised_prefix_count"] = _afi_info.get("sent_prefixes", 0)
+            item["accepted_prefix_count"] = _afi_info.get("accepted_prefixes", 0)
+
+    # Converting certain fields into int
+    for key in BGP_DETAIL_INT_FIELDS:
+        if key in item:
+            item[key] = napalm.base.helpers.convert(int, item[key], 0)
+
+    # process maps and lists
+    for f, _name in BGP_DETAIL_POLICY_FIELDS:
+        _val = item.get(f)
+        if _val is not None:
+            r = _val.split()
+            if r:
+                if len(r) >= 2:
+                    item["{0}_{1}".format("import" if "in" in r[0] else "export", _name)] = str(r[1])
+
+                if len(r) == 4:
+                    item["{0}_{1}".format("import" if "in" in r[2] else "export", _name)] = str(r[3])
+
+            # remove raw data from item
+            item.pop(f, None)
+
+    # Conforming with the datatypes defined by the base class
+    item["description"] = str(item.get("description", ""))
+    item["peer_group"] = str(item.get("peer_group", ""))
+    item["remote_address"] = napalm.base.helpers.ip(item["remote_address"])
+    item["previous_connection_state"] = str(item["previous_connection_state"])
+    item["connection_state"] = str(item["connection_state"])
+    item["routing_table"] = str(item["routing_table"])
+    item["router_id"] = napalm.base.helpers.ip(item["router_id"])
+    item["local_address"] = napalm.base.helpers.convert(napalm.base.helpers.ip, item["local_address"])
+
+    return item
+
+
+# Templates with a regex parser that can be used in place of TextFSM
+FAST_PARSERS = {
+    "show_interface": parse_show_interface,
+    "show_interface_brief_wide": parse_show_interface_brief_wide,
+}
+
 
 class NetIronDriver(NetworkDriver):
     """NAPALM Brocade/Foundry netiron Handler."""
@@ -169,6 +674,22 @@ class NetIronDriver(NetworkDriver):
         # or finding the prompt -- these commands seem to work best with a delay factor of 1
         self._show_command_delay_factor = optional_args.pop("show_command_delay_factor", 1)
 
+        # Reuse cached command output between getters until the configuration is changed. When off, output is
+        # only reused within a single getter call, see cached_output_scope
+        self._cache_enabled = optional_args.pop("cache_show_output", True)
+        self._cache_scope_depth = 0
+
+        # Seconds a fetched show running-config is reused for, as the device can be changed by other means
+        self._running_config_ttl = optional_args.pop("running_config_cache_ttl", 30)
+        self._show_running_config_time = 0.0
+
+        # Parse the largest outputs with precompiled regexes rather than TextFSM
+        self.use_fast_parser = optional_args.pop("use_fast_parser", True)
+
+        # paramiko opens the shell channel with a 2MB receive window. On high latency links large show output
+        # (show interface, show running-config) may transfer faster with a bigger window, so allow it to be raised
+        self._ssh_window_size = optional_args.pop("ssh_window_size", None)
+
         # Netmiko possible arguments
         netmiko_argument_map = {
             "port": None,
@@ -187,15 +708,14 @@ class NetIronDriver(NetworkDriver):
         }
 
         # Build dict of any optional Netmiko args
-        self.netmiko_optional_args = {}
-        for k, v in netmiko_argument_map.items():
-            try:
-                self.netmiko_optional_args[k] = optional_args[k]
-            except KeyError:
-                pass
+        self.netmiko_optional_args = {k: optional_args[k] for k in netmiko_argument_map if k in optional_args}
 
         self.port = optional_args.get("port", 22)
         self.device = None
+
+        # Local address the device fetches the merge candidate from, looked up once per connection
+        self._local_ipaddress = None
+        self._hostname_inferred = None
         self.merge_candidate = False
 
         self.profile = ["netiron"]
@@ -206,13 +726,32 @@ class NetIronDriver(NetworkDriver):
         self.show_vlan = None
         self.show_running_config_lag = None
         self.show_mpls_config = None
+        self.show_mpls_interface_brief = None
+        self.show_running_config = None
+        self.show_running_config_interface = None
+
+        # Cached command output parsed with textfsm, keyed by the attribute holding the output
+        self.parsed_output = {}
 
         # Cached interface number to name dict
         self.interface_map = None
 
+        # Cached port name to standardized interface name dict, built from interface_map
+        self._standardized_names = {}
+
+        # Cached (slot, port) to interface name dict, built from interface_map
+        self._interfaces_by_number = {}
+
+        # Cached lag name to lag details dict
+        self.lags = None
+
+        # Cached show vlan records with their ports expanded, paired with the parsed output they were built from
+        self._vlan_ports = None
+
     def open(self):
         """Open a connection to the device."""
         device_type = "brocade_netiron"
+        self._local_ipaddress = None
 
         if self._use_proxy:
             logger.info("{0}: using SSH proxy {1}".format(self.hostname, self._use_proxy))
@@ -256,13 +795,43 @@ class NetIronDriver(NetworkDriver):
                 **self.netmiko_optional_args,
             )
 
+            # Not applied via the proxy; a new shell would be on the proxy rather than the device
+            if self._ssh_window_size:
+                self._set_ssh_window_size(self._ssh_window_size)
+
         # ensure in enable mode
         self.device.enable()
 
+        # Hostname inferred from the prompt, which does not change for the life of the connection
+        self._hostname_inferred = self.device.base_prompt.replace("SSH@", "")
+
     def close(self):
         """Close the connection to the device."""
         self.device.disconnect()
 
+    def _set_ssh_window_size(self, window_size):
+        """Reopen the interactive SSH channel with a receive window of window_size bytes.
+
+        The window of an open channel cannot be changed, so a new shell is started on the existing transport
+        and the session is prepared again (prompt detection, paging) before the old channel is closed.
+        """
+        old_conn = self.device.remote_conn
+        transport = old_conn.get_transport()
+        if window_size <= old_conn.in_window_size:
+            return
+
+        transport.default_window_size = window_size
+        remote_conn = transport.open_session(window_size=window_size)
+        remote_conn.get_pty(term="vt100", width=511, height=1000)
+        remote_conn.invoke_shell()
+        remote_conn.settimeout(self.device.blocking_timeout)
+
+        self.device.remote_conn = remote_conn
+        self.device.channel = SSHChannel(conn=remote_conn, encoding=self.device.encoding)
+        old_conn.close()
+
+        self.device.session_preparation()
+
     def _send_command(self, command):
         """Wrapper for self.device.send.command().
 
@@ -281,18 +850,144 @@ class NetIronDriver(NetworkDriver):
         except (socket.error, EOFError) as e:
             raise ConnectionClosedException(str(e))
 
+    def _send_commands_batched(self, commands):
+        """Send several commands in a single write and return their output keyed by command.
+
+        The device answers each command with its echo, the output and then the prompt, so rather
+        than waiting for the prompt after every command the combined output is split on the prompt.
+        This is only safe for the driver's own show commands: they never prompt for input or change
+        the prompt, and their output does not contain it. User commands go through cli() one by one.
+        """
+        not_show = [command for command in commands if not command.startswith("show ")]
+        if not_show:
+            raise ValueError("Only show commands can be batched, not {}".format(not_show))
+
+        prompt = re.compile(r"{}[>#]".format(re.escape(self.device.base_prompt)))
+        # A prompt is one character longer than this, so keeping this much of the earlier output is enough to find
+        # a prompt split between two reads without searching everything received again
+        overlap = len(self.device.base_prompt)
+
+        try:
+            self.device.write_channel("\n".join(commands) + "\n")
+
+            chunks = []
+            tail = ""
+            tail_offset = 0
+            last_end = 0
+            found = 0
+            # An idle timeout, so that long outputs finish as long as they keep arriving
+            deadline = time.time() + self.timeout
+            while found < len(commands):
+                data = self.device.read_channel()
+                if not data:
+                    if time.time() > deadline:
+                        raise CommandErrorException("Timed out waiting for output of {}".format(commands))
+                    time.sleep(0.1)
+                    continue
+                deadline = time.time() + self.timeout
+                chunks.append(data)
+
+                tail += data
+                for m in prompt.finditer(tail):
+                    if tail_offset + m.start() >= last_end:
+                        found += 1
+                        last_end = tail_offset + m.end()
+                cut = max(len(tail) - overlap, 0)
+                tail_offset += cut
+                tail = tail[cut:]
+        except (socket.error, EOFError) as e:
+            raise ConnectionClosedException(str(e))
+
+        output = "".join(chunks)
+        result = {}
+        chunks = prompt.split(output.replace("\r\n", "\n"))
+        for command, chunk in zip(commands, chunks):
+            # Drop the echoed command line
+            result[command] = chunk.split("\n", 1)[1].rstrip("\n") if "\n" in chunk else ""
+        return result
+
+    def _prefetch_show_commands(self, *attrs, commands=()):
+        """Populate the cached command output attributes in attrs, fetching any missing ones in one batch.
+
+        The uncached show commands in commands are sent in the same batch, and their output is returned keyed by
+        command.
+        """
+        missing = [attr for attr in attrs if getattr(self, attr) is None]
+        if not missing and not commands:
+            return {}
+
+        output = self._send_commands_batched(list(commands) + [CACHED_SHOW_COMMANDS[attr] for attr in missing])
+        for attr in missing:
+            setattr(self, attr, output[CACHED_SHOW_COMMANDS[attr]])
+            self.parsed_output.pop(attr, None)
+        return output
+
+    def _parse_cached_output(self, attr, template):
+        """Return the cached command output in attr parsed with template, parsing it once per fetch."""
+        self._prefetch_show_commands(attr)
+        if attr not in self.parsed_output:
+            if self.use_fast_parser and template in FAST_PARSERS:
+                self.parsed_output[attr] = FAST_PARSERS[template](getattr(self, attr))
+            else:
+                self.parsed_output[attr] = textfsm_extractor(self, template, getattr(self, attr))
+        return self.parsed_output[attr]
+
+    def _cached_running_config(self):
+        """Return the cached show running-config if it was fetched within the TTL, otherwise None."""
+        if self.show_running_config is None:
+            return None
+        if time.time() - self._show_running_config_time > self._running_config_ttl:
+            return None
+        return self.show_running_config
+
+    def _get_running_config(self):
+        """Return show running-config, reusing the cached copy while it is within the TTL."""
+        config = self._cached_running_config()
+        if config is None:
+            self.show_running_config = None
+            self._prefetch_show_commands("show_running_config")
+            self._show_running_config_time = time.time()
+            config = self.show_running_config
+        return config
+
+    def _clear_cached_output(self):
+        """Forget all cached command output and anything derived from it."""
+        for attr in CACHED_SHOW_COMMANDS:
+            setattr(self, attr, None)
+        self.parsed_output = {}
+        self.interface_map = None
+        self.lags = None
+        self._vlan_ports = None
+
+    def _get_vlan_ports(self):
+        """Return (vlan, name, ve, tagged, untagged) for each show vlan record, expanding the port lists to
+        interface names once per fetch."""
+        info = self._parse_cached_output("show_vlan", "show_vlan")
+        if self._vlan_ports is None or self._vlan_ports[0] is not info:
+            vlan_ports = [
+                (
+                    vlan["vlan"],
+                    vlan["name"],
+                    self.interface_list_conversion(vlan["ve"], "", ""),
+                    self.interfaces_to_list(vlan["taggedports"]),
+                    self.interfaces_to_list(vlan["untaggedports"]),
+                )
+                for vlan in info
+            ]
+            self._vlan_ports = (info, vlan_ports)
+        return self._vlan_ports[1]
+
     # NAPALM FUNCTIONS
 
     def is_alive(self):
         """Returns a flag with the state of the connection."""
-        null = chr(0)
         _status = False
 
         if self.device:
             # SSH
             try:
                 # Try sending ASCII null byte to maintain the connection alive
-                self.device.write_channel(null)
+                self.device.write_channel(NULL_BYTE)
                 _status = self.device.remote_conn.transport.is_active()
             except (socket.error, EOFError):
                 # If unable to send, we can tell for sure that the connection is unusable
@@ -332,18 +1027,34 @@ class NetIronDriver(NetworkDriver):
         if not self.merge_candidate:
             raise MergeConfigException("No merge candidate loaded")
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Setup TFTP server
-            tftp_server = tftpy.TftpServer(tftproot=temp_dir, dyn_file_func=self._tftp_handler(self.merge_candidate))
-            tftp_thread = Thread(target=tftp_server.listen)
+        # Only needed to commit, so not imported with the module
+        import tftpy
+
+        # Serve a private directory that holds nothing but the candidate, so no other file can be read through
+        # the server and nothing planted in a shared directory can stand in for the candidate
+        with tempfile.TemporaryDirectory(dir=self._tmp_working_path) as temp_dir:
+            with open(os.path.join(temp_dir, "merge_candidate"), "w") as f:
+                f.write(self.merge_candidate)
+
+            # Uploads are refused by returning no file to write them to
+            tftp_server = tftpy.TftpServer(tftproot=temp_dir, upload_open=lambda path, context: None)
+            tftp_thread = Thread(target=tftp_server.listen, kwargs={"timeout": TFTP_SERVER_TIMEOUT})
             tftp_thread.daemon = True
             tftp_thread.start()
 
-            result = self._send_command(["copy tftp running-config " + self._get_ipaddress() + " merge_candidate"])
-            logger.info(result)
+            try:
+                # Make sure the server is bound before asking the device to fetch from it
+                if not tftp_server.is_running.wait(self.timeout):
+                    raise MergeConfigException("TFTP server did not start")
+
+                result = self._send_command(["copy tftp running-config " + self._get_ipaddress() + " merge_candidate"])
+                logger.info(result)
+            finally:
+                tftp_server.stop()
+                tftp_thread.join()
 
-            tftp_server.stop()
-            tftp_thread.join()
+        # The running config has changed
+        self._clear_cached_output()
 
     def discard_config(self):
         """Discard loaded candidate configurations."""
@@ -434,6 +1145,7 @@ class NetIronDriver(NetworkDriver):
         """
         raise NotImplementedError
 
+    @cached_output_scope
     def get_facts(self):
         """get_facts method."""
         uptime = -1
@@ -443,30 +1155,29 @@ class NetIronDriver(NetworkDriver):
         version = "netiron"
         serial = None
 
-        command = "show version"
-        lines = self.device.send_command_timing(command, delay_factor=self._show_command_delay_factor)
-        for line in lines.splitlines():
-            r1 = re.match(r"^(System|Chassis):\s+(.*)\s+\(Serial #:\s+(\S+),(.*)", line)
-            if r1:
-                model = r1.group(2)
-                serial = r1.group(3)
+        # show version and show uptime change over time so they are never cached, but go in the same batch
+        output = self._prefetch_show_commands(
+            "show_int_brief_wide", "show_int", "show_running_config_lag", commands=("show version", "show uptime")
+        )
 
-            r2 = re.match(r"^IronWare : Version\s+(\S+)\s+Copyright \(c\)\s+(.*)", line)
-            if r2:
-                version = r2.group(1)
-                vendor = r2.group(2)
+        for line in iter_lines(output["show version"]):
+            # Only a handful of lines are of interest; skip the rest without running a regex
+            if line.startswith(("System:", "Chassis:")):
+                r1 = RE_VERSION_SYSTEM.match(line)
+                if r1:
+                    model = r1.group(2)
+                    serial = r1.group(3)
+            elif line.startswith("IronWare"):
+                r2 = RE_VERSION_IRONWARE.match(line)
+                if r2:
+                    version = r2.group(1)
+                    vendor = r2.group(2)
 
-        command = "show uptime"
-        lines = self.device.send_command_timing(command, delay_factor=self._show_command_delay_factor)
-        for line in lines.splitlines():
+        for line in iter_lines(output["show uptime"]):
             # Get the uptime from the Active MP module
-            r1 = re.match(
-                r"\s+Active MP(.*)Uptime\s+(\d+)\s+days"
-                r"\s+(\d+)\s+hours"
-                r"\s+(\d+)\s+minutes"
-                r"\s+(\d+)\s+seconds",
-                line,
-            )
+            if "Active MP" not in line:
+                continue
+            r1 = RE_UPTIME.match(line)
             if r1:
                 days = int(r1.group(2))
                 hours = int(r1.group(3))
@@ -475,7 +1186,7 @@ class NetIronDriver(NetworkDriver):
                 uptime = seconds + minutes * 60 + hours * 3600 + days * 86400
 
         # Infer hostname from the prompt
-        hostname = self.device.base_prompt.replace("SSH@", "")
+        hostname = self._hostname_inferred or self.device.base_prompt.replace("SSH@", "")
 
         facts = {
             "uptime": float(uptime),
@@ -486,77 +1197,70 @@ class NetIronDriver(NetworkDriver):
             "fqdn": str("Unknown"),
             "os_version": str(version),
             "serial_number": str(serial),
-            "interface_list": [],
         }
 
         # Get interfaces
-        if not self.show_int_brief_wide or "pytest" in sys.modules:
-            self.show_int_brief_wide = self.device.send_command_timing(
-                "show int brief wide", delay_factor=self._show_command_delay_factor
-            )
-        info = textfsm_extractor(self, "show_interface_brief_wide", self.show_int_brief_wide)
-        for interface in info:
-            port = self.standardize_interface_name(interface["port"])
-            facts["interface_list"].append(port)
+        info = self._parse_cached_output("show_int_brief_wide", "show_interface_brief_wide")
+        facts["interface_list"] = [self.standardize_interface_name(interface["port"]) for interface in info]
 
         # Add lags to interfaces
-        lags = self.get_lags()
-        facts["interface_list"] += list(lags.keys())
+        facts["interface_list"].extend(self.get_lags())
 
         return facts
 
+    @cached_output_scope
     def get_interfaces(self):
         """get_interfaces method."""
-        if not self.show_int or "pytest" in sys.modules:
-            self.show_int = self.device.send_command_timing(
-                "show interface", delay_factor=self._show_command_delay_factor
-            )
-        info = textfsm_extractor(self, "show_interface", self.show_int)
-
-        show_mpls_interface = self.device.send_command_timing(
-            "show mpls interface brief", delay_factor=self._show_command_delay_factor
+        self._prefetch_show_commands(
+            "show_int", "show_vlan", "show_mpls_config", "show_mpls_interface_brief", "show_running_config_lag"
         )
-        mpls_info = textfsm_extractor(self, "show_mpls_interface_brief", show_mpls_interface)
+        info = self._parse_cached_output("show_int", "show_interface")
+        mpls_info = self._parse_cached_output("show_mpls_interface_brief", "show_mpls_interface_brief")
 
         vlans = self.get_vlans()
 
+        # Index VLAN members by Ve so each Ve's children are found without scanning every VLAN
+        ve_vlan_members = {}
+        for vlan, data in vlans.items():
+            for interface in data["interfaces"]:
+                if interface.startswith("Ve"):
+                    ve_vlan_members.setdefault(interface, {})[vlan] = data["interfaces"]
+
+        # Ports share a handful of speed strings, so convert each one once
+        speeds = {}
+
         result = {}
         for interface in info:
             port = self.standardize_interface_name(interface["port"])
+            link = interface["link"].lower()
 
             # Convert speeds to MB/s
-            speed = interface["speed"]
-            SPEED_REG = r"^(?P<number>\d+)(?P<unit>\S+)$"
-            speed_m = re.match(SPEED_REG, speed)
-            if speed_m:
-                if speed_m.group("unit") in ["M", "Mbit"]:
-                    speed = int(int(speed_m.group("number")))
-                elif speed_m.group("unit") in ["G", "Gbit"]:
-                    speed = int(int(speed_m.group("number")) * 10e2)
-            if speed == "unknown" or not speed:
+            speed = speeds.get(interface["speed"])
+            if speed is None:
                 speed = 0
+                speed_m = RE_SPEED.match(interface["speed"])
+                if speed_m:
+                    speed = int(speed_m.group("number")) * SPEED_UNIT_MULTIPLIER.get(speed_m.group("unit"), 0)
+                speeds[interface["speed"]] = speed = float(speed)
 
             result[port] = {
-                "is_up": interface["link"].lower() == "up",
-                "is_enabled": interface["link"].lower() != "disabled",
+                "is_up": link == "up",
+                "is_enabled": link != "disabled",
                 "description": interface["name"],
                 "last_flapped": float(-1),
-                "speed": float(speed),
+                "speed": speed,
                 "mac_address": interface["mac"],
                 "mtu": int(interface["mtu"]),
                 "mpls_enabled": False,
             }
 
             # Add ve_children to VEs
-            if re.match(r"^Ve", port):
+            if port.startswith("Ve"):
                 # Get list of interfaces with the same VLAN as the Ve, excluding the Ve.
                 # These are the physical interfaces that form the Ve.
-                result[port]["ve_children"] = []
-                for vlan, data in vlans.items():
-                    if port in data["interfaces"]:
-                        for interface in data["interfaces"]:
-                            if interface != port:
-                                result[port]["ve_children"].append(interface)
+                result[port]["ve_children"] = [
+                    member for members in ve_vlan_members.get(port, {}).values() for member in members if member != port
+                ]
 
         # Add MPLS Enabled value
         for mpls_interface in mpls_info:
@@ -570,19 +1274,23 @@ class NetIronDriver(NetworkDriver):
         result.update(lags)
 
         # Remove extra keys to make tests pass
-        if "pytest" in sys.modules:
+        if IN_PYTEST:
             return self._delete_keys_from_dict(result, ["children", "type", "mpls_enabled", "ve_children"])
 
         return result
 
+    @cached_output_scope
     def get_interfaces_ip(self):
         """get_interfaces_ip method."""
         interfaces = {}
 
-        output = self.device.send_command_timing(
-            "show running-config interface", delay_factor=self._show_command_delay_factor
-        )
-        info = textfsm_extractor(self, "show_running_config_interface", output)
+        # show running-config interface is large and get_static_routes needs it too, so it is cached
+        self._prefetch_show_commands("show_running_config_interface")
+        output = self.show_running_config_interface
+        if self.use_fast_parser:
+            info = parse_show_running_config_interface(output)
+        else:
+            info = textfsm_extractor(self, "show_running_config_interface", output)
 
         for intf in info:
             port = self.standardize_interface_name(intf["interface"] + intf["interfacenum"])
@@ -606,21 +1314,19 @@ class NetIronDriver(NetworkDriver):
 
         return interfaces
 
+    @cached_output_scope
     def get_interfaces_vlans(self):
         """return dict as documented at https://github.com/napalm-automation/napalm/issues/919#issuecomment-485905491"""
 
-        if not self.show_int or "pytest" in sys.modules:
-            self.show_int = self.device.send_command_timing(
-                "show interface", delay_factor=self._show_command_delay_factor
-            )
-        info = textfsm_extractor(self, "show_interface", self.show_int)
+        self._prefetch_show_commands("show_int", "show_vlan", "show_mpls_config", "show_running_config_lag")
+        info = self._parse_cached_output("show_int", "show_interface")
 
         result = {}
 
         # Create interfaces structure and correct mode
         for interface in info:
             intf = self.standardize_interface_name(interface["port"])
-            if interface["tag"] == "untagged" or re.match(r"^ve", interface["port"].lower()):
+            if interface["tag"] == "untagged" or interface["port"].lower().startswith("ve"):
                 mode = "access"
             else:
                 mode = "trunk"
@@ -642,27 +1348,19 @@ class NetIronDriver(NetworkDriver):
                 "tagged-native-vlan": False,
             }
 
-        if not self.show_vlan or "pytest" in sys.modules:
-            self.show_vlan = self.device.send_command("show vlan", read_timeout=self.timeout)
-        info = textfsm_extractor(self, "show_vlan", self.show_vlan)
-
         # Assign VLANs to interfaces
-        for vlan in info:
-            access_ports = self.interface_list_conversion(vlan["ve"], "", vlan["untaggedports"])
-            trunk_ports = self.interface_list_conversion("", vlan["taggedports"], "")
+        for vlan_id, _, ve, tagged, untagged in self._get_vlan_ports():
+            if int(vlan_id) > 4094:
+                continue
 
-            for port in access_ports:
-                if int(vlan["vlan"]) <= 4094:
-                    result[port]["access-vlan"] = vlan["vlan"]
+            for port in ve + untagged:
+                result[port]["access-vlan"] = vlan_id
 
-            for port in trunk_ports:
-                if int(vlan["vlan"]) <= 4094:
-                    result[port]["trunk-vlans"].append(vlan["vlan"])
+            for port in tagged:
+                result[port]["trunk-vlans"].append(vlan_id)
 
         # Add ports with VLANs from VLLs
-        if not self.show_mpls_config:
-            self.show_mpls_config = self.device.send_command("show mpls config")
-        info = textfsm_extractor(self, "show_mpls_config", self.show_mpls_config)
+        info = self._parse_cached_output("show_mpls_config", "show_mpls_config")
         for vll in info:
             interface = self.standardize_interface_name(vll["interface"])
             # Ignore VLLs with no interface
@@ -670,29 +1368,25 @@ class NetIronDriver(NetworkDriver):
                 result[interface]["trunk-vlans"].append(vll["vlan"])
 
         # Set native vlan for tagged ports
-        for port, data in result.items():
+        for data in result.values():
             if data["trunk-vlans"] and data["access-vlan"]:
-                result[port]["native-vlan"] = data["access-vlan"]
-                result[port]["access-vlan"] = -1
+                data["native-vlan"] = data["access-vlan"]
+                data["access-vlan"] = -1
 
         return result
 
+    @cached_output_scope
     def get_vlans(self):
-        if not self.show_vlan or "pytest" in sys.modules:
-            self.show_vlan = self.device.send_command("show vlan", read_timeout=self.timeout)
-        info = textfsm_extractor(self, "show_vlan", self.show_vlan)
-
+        self._prefetch_show_commands("show_vlan", "show_mpls_config")
         result = {}
-        for vlan in info:
-            result[vlan["vlan"]] = {
-                "name": vlan["name"],
-                "interfaces": self.interface_list_conversion(vlan["ve"], vlan["taggedports"], vlan["untaggedports"]),
+        for vlan_id, name, ve, tagged, untagged in self._get_vlan_ports():
+            result[vlan_id] = {
+                "name": name,
+                "interfaces": ve + tagged + untagged,
             }
 
         # Add ports with VLANs from VLLs
-        if not self.show_mpls_config or "pytest" in sys.modules:
-            self.show_mpls_config = self.device.send_command("show mpls config")
-        info = textfsm_extractor(self, "show_mpls_config", self.show_mpls_config)
+        info = self._parse_cached_output("show_mpls_config", "show_mpls_config")
         for vll in info:
             if vll["vlan"] not in result:
                 result[vll["vlan"]] = {
@@ -704,6 +1398,7 @@ class NetIronDriver(NetworkDriver):
 
         return result
 
+    @cached_output_scope
     def get_lldp_neighbors(self):
         """
             Returns a dictionary where the keys are local ports and the value is a list of \
@@ -725,7 +1420,7 @@ class NetIronDriver(NetworkDriver):
             if local_port not in my_dict.keys():
                 my_dict[local_port] = []
             my_dict[local_port].append(
-                {"hostname": re.sub('"', "", result["remotesystemname"]), "port": re.sub('"', "", port)}
+                {"hostname": result["remotesystemname"].replace('"', ""), "port": port.replace('"', "")}
             )
 
         return my_dict
@@ -752,9 +1447,8 @@ class NetIronDriver(NetworkDriver):
         :param prefix: IPv6 or IPv6 prefix in CIDR notation
         :return: dictionary of route info on success or error message on error/no route found
         """
-        _prefix_net = IPNetwork(prefix)
-        if not _prefix_net:
-            raise ValueError("prefix must be a valid prefix")
+        # Raises ValueError if not a valid prefix
+        _prefix_net = ipaddress.ip_network(prefix, strict=False)
 
         command = "show ip{0} bgp route {1}".format("" if _prefix_net.version == 4 else "v6", prefix)
         _lines = self.device.send_command(command)
@@ -764,42 +1458,34 @@ class NetIronDriver(NetworkDriver):
         _num_paths_installed = None
 
         # if no routes found; simply return error
-        r1 = re.search(r"None of the BGP4 routes match the display condition", _lines, re.MULTILINE)
+        r1 = RE_BGP_ROUTE_NONE.search(_lines)
         if r1:
             return {"error": "No matching BGP routes found"}
 
-        for line in _lines.splitlines():
-            r2 = re.match(r"^\s*AS_PATH:\s+(?P<path>(.*))", line)
-            if r2 and r1:
-                _routes.append(
-                    {
-                        "index": r1.group("index"),
-                        "prefix": r1.group("prefix"),
-                        "next_hop": r1.group("next_hop"),
-                        "med": r1.group("med"),
-                        "local_pref": r1.group("local_pref"),
-                        "weight": r1.group("weight"),
-                        "status": r1.group("status"),
-                        "best": True if "B" in r1.group("status") else False,
-                        "as_path": r2.group("path").split(),
-                    }
-                )
-                r1 = None
-                continue
-
-            r1 = re.match(
-                r"^(?P<index>(\d+))\s+(?P<prefix>\S+)\s+(?P<next_hop>\S+)"
-                r"\s+(?P<med>\d+)\s+(?P<local_pref>\d+)\s+(?P<weight>\d+)\s+(?P<status>\S+)",
-                line,
-            )
-            if r1:
-                continue
+        # A route line is followed by its AS_PATH line, so only look for AS_PATH right after a route matched and
+        # otherwise use cheap string tests to decide which regex, if any, is worth running
+        expect_as_path = False
+        for line in iter_lines(_lines):
+            if expect_as_path:
+                expect_as_path = False
+                r2 = RE_BGP_AS_PATH.match(line) if line.lstrip().startswith("AS_PATH:") else None
+                if r2:
+                    # The route pattern's named groups are the index, prefix, next_hop, med, local_pref, weight and
+                    # status keys of the route
+                    route = r1.groupdict()
+                    route["best"] = "B" in route["status"]
+                    route["as_path"] = r2.group("path").split()
+                    _routes.append(route)
+                    continue
 
-            r3 = re.match(r"^\s+Last update.*table:\s+(?P<last_update>(\S+)),\s+(?P<paths>\d+)\s+", line)
-            if r3:
-                _last_update = r3.group("last_update")
-                _num_paths_installed = r3.group("paths")
-                continue
+            if line[:1].isdigit():
+                r1 = RE_BGP_ROUTE.match(line)
+                expect_as_path = r1 is not None
+            elif "Last update" in line:
+                r3 = RE_BGP_LAST_UPDATE.match(line)
+                if r3:
+                    _last_update = r3.group("last_update")
+                    _num_paths_installed = r3.group("paths")
 
         return {
             "success": {
@@ -886,9 +1572,8 @@ class NetIronDriver(NetworkDriver):
         if protocol != "bgp":
             raise ValueError("unsupported routing protocol: {0}".format(protocol))
 
-        _prefix_net = IPNetwork(destination)
-        if not _prefix_net:
-            raise ValueError("prefix must be a valid prefix")
+        # Raises ValueError if not a valid prefix
+        _prefix_net = ipaddress.ip_network(destination, strict=False)
 
         command = "show ip{0} bgp route {1}".format("" if _prefix_net.version == 4 else "v6", destination)
         logger.info(command)
@@ -900,69 +1585,59 @@ class NetIronDriver(NetworkDriver):
         _num_paths_installed = None
 
         # if no routes found; simply return error
-        r1 = re.search(r"None of the BGP4 routes match the display condition", _lines, re.MULTILINE)
+        r1 = RE_BGP_ROUTE_NONE.search(_lines)
         if r1:
             return {"error": "No matching BGP routes found"}
 
         _r1v6 = None
         _previous_line = None
-        for line in _lines.splitlines():
+        for line in iter_lines(_lines):
             if _r1v6:
                 # v6 is rendered differently than v4 -- v6 splits prefix info into (2) lines
                 # if _rlv6 is True then the 1st line containing index, prefix and next_hop was matched
                 # on the previous line
                 #
-                # join previous line and current line and perform r1 match
+                # join previous line and current line; r1 is matched against the joined line below
                 line = "{0} {1}".format(_previous_line, line)
-                r1 = re.match(
-                    r"^(?P<index>(\d+))\s+(?P<prefix>\S+)\s+(?P<next_hop>\S+)"
-                    r"\s+(?P<med>\d+)\s+(?P<local_pref>\d+)\s+(?P<weight>\d+)\s+(?P<status>\S+)",
-                    line,
-                )
                 _r1v6 = None
 
             _previous_line = line
 
-            r2 = re.match(r"^\s*AS_PATH:\s+(?P<path>(.*))", line)
+            # Route lines start with their index, so only those and AS_PATH lines are worth a regex
+            r2 = RE_BGP_AS_PATH.match(line) if "AS_PATH:" in line else None
             if r2 and r1:
-                _status = r1.group("status")
-                _active = True if "B" in _status else False
-                _routes.append(
-                    {
-                        "protocol": "eBGP" if "E" in _status else "iBGP",
-                        "inactive_reason": "n/a",
-                        "age": 0,
-                        "routing_table": "default",
-                        "next_hop": r1.group("next_hop"),
-                        "outgoing_interface": None,
-                        "preference": 20 if "E" in _status else 200,
-                        "current_active": _active,
-                        "selected_next_hop": _active,
-                        "protocol_attributes": {
-                            "local_preference": r1.group("local_pref"),
-                            "remote_as": "n/a",
-                            "communities": [],
-                            "preference2": 0,
-                            "metric": napalm.base.helpers.convert(int, r1.group("med"), 0),
-                            "weight": napalm.base.helpers.convert(int, r1.group("weight"), 0),
-                            "status": r1.group("status"),
-                            "local_as": 22822,
-                            "as_path": r2.group("path").split(),
-                            "remote_address": r1.group("next_hop"),
-                        },
-                    }
+                next_hop, local_pref, med, weight, status = r1.group(
+                    "next_hop", "local_pref", "med", "weight", "status"
                 )
+                _protocol, _preference, _active = bgp_route_status(status)
+
+                # copy the constant fields from the templates and fill in the rest; med and weight are
+                # matched as digits so int() can't fail
+                route = BGP_ROUTE_TEMPLATE.copy()
+                route["protocol"] = _protocol
+                route["next_hop"] = next_hop
+                route["preference"] = _preference
+                route["current_active"] = _active
+                route["selected_next_hop"] = _active
+
+                attributes = BGP_ROUTE_ATTRIBUTES_TEMPLATE.copy()
+                attributes["local_preference"] = local_pref
+                attributes["communities"] = []
+                attributes["metric"] = int(med)
+                attributes["weight"] = int(weight)
+                attributes["status"] = status
+                attributes["as_path"] = r2.group("path").split()
+                attributes["remote_address"] = next_hop
+                route["protocol_attributes"] = attributes
+
+                _routes.append(route)
                 r1 = None
                 _r1v6 = None
                 continue
 
-            r1 = re.match(
-                r"^(?P<index>(\d+))\s+(?P<prefix>\S+)\s+(?P<next_hop>\S+)"
-                r"\s+(?P<med>\d+)\s+(?P<local_pref>\d+)\s+(?P<weight>\d+)\s+(?P<status>\S+)",
-                line,
-            )
+            r1 = RE_BGP_ROUTE.match(line) if line[:1].isdigit() else None
 
-            if not r1 and _prefix_net.version == 6:
+            if not r1 and _prefix_net.version == 6 and line[:1].isdigit():
                 # brocade renders differently for v6 than it does for v4 -- this is likely due to the length
                 # difference between a v4 and v6 address
                 # brocade renders v6 prefix over (2) lines.  The 1st line has prefix and next-hop where
@@ -972,7 +1647,7 @@ class NetIronDriver(NetworkDriver):
                 #                                           0          320        0      BI
                 #
                 # if r1 didn't match try matching just index, prefix and next_hop
-                _r1v6 = re.match(r"^(?P<index>(\d+))\s+(?P<prefix>\S+)\s+(?P<next_hop>\S+)", line)
+                _r1v6 = RE_BGP_ROUTE_V6_FIRST_LINE.match(line)
 
         return {destination: _routes}
 
@@ -983,139 +1658,62 @@ class NetIronDriver(NetworkDriver):
         FIXME: No VRF support
         :return: dict()
         """
-        bgp_data = dict()
-        bgp_data["global"] = dict()
-        bgp_data["global"]["peers"] = dict()
-
-        lines_summary = ""
-        lines_neighbors = ""
-
         _stat_errors = dict()
 
-        # retrieve both v4 and v6 BGP summary and neighbors
-        for v in [4, 6]:
-            command = "show ip{0} bgp summary".format("" if v == 4 else "v6")
-            _lines = self.device.send_command(command)
-            lines_summary += _lines + "\n" if _lines else ""
-
-            command = "show ip{0} bgp neighbors".format("" if v == 4 else "v6")
-            _lines = self.device.send_command(command)
-            lines_neighbors += _lines + "\n" if _lines else ""
-
-        local_as = 0
-        for line in lines_summary.splitlines():
-            r1 = re.match(
-                r"^\s+Router ID:\s+(?P<router_id>({}))\s+"
-                r"Local AS Number:\s+(?P<local_as>({}))".format(IPV4_ADDR_REGEX, ASN_REGEX),
-                line,
-            )
-            if r1:
-                # FIXME: Use AS numbers check: napalm.base.helpers.as_number
-                router_id = r1.group("router_id")
-                local_as = r1.group("local_as")
-                # FIXME check the router_id looks like an ipv4 address
-                # router_id = napalm.base.helpers.ip(router_id, version=4)
-                bgp_data["global"]["router_id"] = router_id
-                continue
-
-            # Neighbor Address  AS#         State   Time          Rt:Accepted Filtered Sent     ToSend
-            # 12.12.12.12       513         ESTAB   587d7h24m    0           0        255      0
-            # NOTE: uptime is not always a single string!
-            r2 = re.match(
-                r"^\s+(?P<remote_addr>({}|{}))\s+(?P<remote_as>({}))\s+(?P<state>\S+)\s+"
-                r"(?P<uptime>.+)"
-                r"\s\s+(?P<accepted_prefixes>\d+)"
-                r"\s+(?P<filtered_prefixes>\d+)"
-                r"\s+(?P<sent_prefixes>\d+)"
-                r"\s+(?P<tosend_prefixes>\d+)".format(IPV4_ADDR_REGEX, IPV6_ADDR_REGEX, ASN_REGEX),
-                line,
-            )
-            if r2:
-                remote_addr = napalm.base.helpers.IPAddress(r2.group("remote_addr"))
-
-                afi = "ipv4" if remote_addr.version == 4 else "ipv6"
-                received_prefixes = int(r2.group("accepted_prefixes")) + int(r2.group("filtered_prefixes"))
-                bgp_data["global"]["peers"][str(remote_addr)] = {
-                    "local_as": local_as,
-                    "remote_as": r2.group("remote_as"),
-                    "address_family": {
-                        afi: {
-                            "received_prefixes": received_prefixes,
-                            "accepted_prefixes": r2.group("accepted_prefixes"),
-                            "filtered_prefixes": r2.group("filtered_prefixes"),
-                            "sent_prefixes": r2.group("sent_prefixes"),
-                            "to_send_prefixes": r2.group("tosend_prefixes"),
-                        }
-                    },
-                }
-                continue
-
-            # There is a case where brocade's formatting doesn't account for overruns and numbers are displayed
-            # without a space between fields:
-            # 2607:f4e8::26             22822       ESTAB   349d16h40m    1466        1191838648268     0
-            # in this case just grab the 1st (4) fields and add the remote_addr to the _stats_error dict
-            r2 = re.match(
-                r"^\s+(?P<remote_addr>({}|{})\s+(?P<remote_as>({}))\s+(?P<state>\S+)\s+"
-                r"(?P<uptime>.+)\s".format(IPV4_ADDR_REGEX, IPV6_ADDR_REGEX, ASN_REGEX),
-                line,
-            )
-            if r2:
-                logger.info("brocade overflow bug: line: {}".format(line))
-                logger.info(r2.group())
-                try:
-                    remote_addr = napalm.base.helpers.IPAddress(r2.group("remote_addr"))
-                    bgp_data["global"]["peers"][str(remote_addr)] = {
-                        "local_as": local_as,
-                        "remote_as": r2.group("remote_as"),
-                        "address_family": self.__get_bgp_route_stats__(remote_addr),
-                    }
-                except Exception as ex:
-                    logger.warn("unable to process overflow bug line: {}".format(ex))
-
-        # pprint.pprint(bgp_data)
-
-        current = ""
-        for line in lines_neighbors.splitlines():
-            r1 = re.match(
-                r"^\d+\s+IP Address:\s+(?P<remote_addr>\S+),"
-                r"\s+AS:\s+(?P<remote_as>({}))"
-                r"\s+\((IBGP|EBGP)\), RouterID:\s+(?P<remote_id>({})),"
-                r"\s+VRF:\s+(?P<vrf_name>\S+)".format(ASN_REGEX, IPV4_ADDR_REGEX),
-                line,
-            )
+        # retrieve both v4 and v6 BGP summary and neighbors. There is a single shell channel to the device so
+        # rather than waiting for each command in turn they are all sent in one batch
+        summary_commands = ["show ip bgp summary", "show ipv6 bgp summary"]
+        neighbor_commands = ["show ip bgp neighbors", "show ipv6 bgp neighbors"]
+        output = self._send_commands_batched(summary_commands + neighbor_commands)
+
+        # each summary has its own Router ID header so they are processed in turn into the same bgp_data
+        bgp_data = None
+        for command in summary_commands:
+            bgp_data = self._process_bgp_summary(output[command], bgp_data)
+
+        # join once rather than growing a string per command
+        lines_neighbors = "\n".join(output[command] for command in neighbor_commands if output[command])
+
+        # Each neighbor block starts with its IP Address line followed by the Description and State lines, so the
+        # body patterns are only tried while inside the block of a peer known from the summary
+        current = None
+        for line in iter_lines(lines_neighbors):
+            r1 = RE_BGP_NEIGHBOR.match(line) if "IP Address:" in line else None
             if r1:
                 remote_addr = r1.group("remote_addr")
 
                 if remote_addr not in bgp_data["global"]["peers"]:
-                    print("{0} not found".format(remote_addr))
+                    logger.debug("{0} not found".format(remote_addr))
+                    current = None
                     continue
 
                 # if remote_addr in bgp_data['global']['peers']:
                 #    raise ValueError('%s already exists'.format(remote_addr))
 
-                # pprint.pprint(remote_addr)
-                remote_id = r1.group("remote_id")
-                bgp_data["global"]["peers"][remote_addr]["remote_as"] = r1.group("remote_as")
+                remote_as, remote_id = r1.group("remote_as", "remote_id")
+                bgp_data["global"]["peers"][remote_addr]["remote_as"] = remote_as
                 bgp_data["global"]["peers"][remote_addr]["remote_id"] = remote_id
                 current = remote_addr
+                continue
 
-            r2 = re.match(r"\s+Description:\s+(.*)", line)
+            if current is None:
+                continue
+
+            r2 = RE_BGP_NEIGHBOR_DESCRIPTION.match(line) if "Description:" in line else None
             if r2:
                 description = r2.group(1)
-                # pprint.pprint(description)
                 bgp_data["global"]["peers"][current]["description"] = description
+                continue
 
             # line:    State: ESTABLISHED, Time: 587d7h24m52s, KeepAliveTime: 10, HoldTime: 30
-            r3 = re.match(
-                r"\s+State:\s+(\S+),\s+Time:\s+(\S+)," r"\s+KeepAliveTime:\s+(\d+)," r"\s+HoldTime:\s+(\d+)", line
-            )
+            r3 = RE_BGP_NEIGHBOR_STATE.match(line) if "State:" in line else None
             if r3:
-                state = r3.group(1)
+                state, uptime = r3.group(1, 2)
 
                 bgp_data["global"]["peers"][current]["state"] = state
                 bgp_data["global"]["peers"][current]["is_up"] = True if "ESTABLISHED" in state else False
                 bgp_data["global"]["peers"][current]["is_enabled"] = False if "ADMIN_SHUTDOWN" in state else True
-                bgp_data["global"]["peers"][current]["uptime"] = r3.group(2)
+                bgp_data["global"]["peers"][current]["uptime"] = uptime
 
         return bgp_data
 
@@ -1129,187 +1727,7 @@ class NetIronDriver(NetworkDriver):
         :return dictionary of neighbor data keyed by AS
         """
 
-        def __process_bgp_summary_data__(lines_summary):
-            """
-            Process BGP summary data
-            Args:
-                lines_summary (str):
-
-            Returns:
-                bgp_data (dict):
-            """
-
-            bgp_data = dict()
-            bgp_data["global"] = dict()
-            bgp_data["global"]["peers"] = dict()
-
-            local_as = 0
-            for line in lines_summary.splitlines():
-                r1 = re.match(
-                    r"^\s+Router ID:\s+(?P<router_id>({}))\s+"
-                    r"Local AS Number:\s+(?P<local_as>({}))".format(IPV4_ADDR_REGEX, ASN_REGEX),
-                    line,
-                )
-                if r1:
-                    # FIXME: Use AS numbers check: napalm.base.helpers.as_number
-                    router_id = r1.group("router_id")
-                    local_as = r1.group("local_as")
-                    # FIXME check the router_id looks like an ipv4 address
-                    # router_id = napalm.base.helpers.ip(router_id, version=4)
-                    bgp_data["global"]["router_id"] = router_id
-                    continue
-
-                # Neighbor Address  AS#         State   Time          Rt:Accepted Filtered Sent     ToSend
-                # 12.12.12.12       513         ESTAB   587d7h24m    0           0        255      0
-                # NOTE: uptime is not always a single string!
-                r2 = re.match(
-                    r"^\s+(?P<remote_addr>({}|{}))\s+(?P<remote_as>({}))\s+(?P<state>\S+)\s+"
-                    r"(?P<uptime>.+)"
-                    r"\s\s+(?P<accepted_prefixes>\d+)"
-                    r"\s+(?P<filtered_prefixes>\d+)"
-                    r"\s+(?P<sent_prefixes>\d+)"
-                    r"\s+(?P<tosend_prefixes>\d+)".format(IPV4_ADDR_REGEX, IPV6_ADDR_REGEX, ASN_REGEX),
-                    line,
-                )
-                if r2:
-                    remote_addr = napalm.base.helpers.IPAddress(r2.group("remote_addr"))
-
-                    afi = "ipv4" if remote_addr.version == 4 else "ipv6"
-                    received_prefixes = int(r2.group("accepted_prefixes")) + int(r2.group("filtered_prefixes"))
-                    bgp_data["global"]["peers"][str(remote_addr)] = {
-                        "local_as": local_as,
-                        "remote_as": r2.group("remote_as"),
-                        "address_family": {
-                            afi: {
-                                "received_prefixes": received_prefixes,
-                                "accepted_prefixes": r2.group("accepted_prefixes"),
-                                "filtered_prefixes": r2.group("filtered_prefixes"),
-                                "sent_prefixes": r2.group("sent_prefixes"),
-                                "to_send_prefixes": r2.group("tosend_prefixes"),
-                            }
-                        },
-                    }
-                    continue
-
-                # There is a case where brocade's formatting doesn't account for overruns and numbers are displayed
-                # without a space between fields:
-                # 2607:f4e8::26             22822       ESTAB   349d16h40m    1466        1191838648268     0
-                # in this case just grab the 1st (4) fields and add the remote_addr to the _stats_error dict
-                r2 = re.match(
-                    r"^\s+(?P<remote_addr>({}|{}))\s+(?P<remote_as>({}))\s+(?P<state>\S+)\s+"
-                    r"(?P<uptime>.+)\s".format(IPV4_ADDR_REGEX, IPV6_ADDR_REGEX, ASN_REGEX),
-                    line,
-                )
-                if r2:
-                    logger.info("brocade overflow bug: line: {}".format(line))
-                    logger.info(r2.group())
-                    try:
-                        remote_addr = napalm.base.helpers.IPAddress(r2.group("remote_addr"))
-                        bgp_data["global"]["peers"][str(remote_addr)] = {
-                            "local_as": local_as,
-                            "remote_as": r2.group("remote_as"),
-                            "address_family": self.__get_bgp_route_stats__(remote_addr),
-                        }
-                    except Exception as ex:
-                        logger.warn("unable to process overflow bug line: {}".format(ex))
-
-            return bgp_data
-
-        def _parse_per_peer_bgp_detail(peer_output):
-            """This function parses the raw data per peer and returns a
-            json structure per peer.
-            """
-
-            int_fields = [
-                "local_as",
-                "remote_as",
-                "local_port",
-                "remote_port",
-                "local_port",
-                "input_messages",
-                "output_messages",
-                "input_updates",
-                "output_updates",
-                "messages_queued_out",
-                "holdtime",
-                "configured_holdtime",
-                "keepalive",
-                "configured_keepalive",
-                "advertised_prefix_count",
-                "received_prefix_count",
-            ]
-
-            peer_details = []
-
-            # Using preset template to extract peer info
-            _peer_info = napalm_base.helpers.textfsm_extractor(self, "bgp_detail", peer_output)
-
-            for item in _peer_info:
-                # Determining a few other fields in the final peer_info
-                item["up"] = True if item["connection_state"] == "ESTABLISHED" else False
-                item["local_address_configured"] = True if item["local_address"] else False
-                item["multihop"] = True if item["multihop"] == "yes" else False
-                item["remove_private_as"] = True if item["remove_private_as"] == "yes" else False
-
-                # TODO: The below fields need to be retrieved
-                # Currently defaulting their values to False or 0
-                item["multipath"] = False
-                item["suppress_4byte_as"] = False
-                item["local_as_prepend"] = False
-                item["flap_count"] = 0
-                item["active_prefix_count"] = 0
-                item["suppressed_prefix_count"] = 0
-
-                # Converting certain fields into int
-                for key in int_fields:
-                    if key in item:
-                        item[key] = napalm_base.helpers.convert(int, item[key], 0)
-
-                # process maps and lists
-                for f in ["route_map", "filter_list", "prefix_list"]:
-                    _val = item.get(f)
-                    if _val is not None:
-                        r = _val.split()
-                        if r:
-                            # print 'r: ', r
-                            # print len(r)
-                            _name = "policy" if f == "route_map" else f
-                            if len(r) >= 2:
-                                item["{0}_{1}".format("import" if "in" in r[0] else "export", _name)] = str(r[1])
-
-                            if len(r) == 4:
-                                item["{0}_{1}".format("import" if "in" in r[2] else "export", _name)] = str(r[3])
-
-                        # remove raw data from item
-                        item.pop(f, None)
-
-                # Conforming with the datatypes defined by the base class
-                item["description"] = str(item.get("description", ""))
-                item["peer_group"] = str(item.get("peer_group", ""))
-                item["remote_address"] = napalm_base.helpers.ip(item["remote_address"])
-                item["previous_connection_state"] = str(item["previous_connection_state"])
-                item["connection_state"] = str(item["connection_state"])
-                item["routing_table"] = str(item["routing_table"])
-                item["router_id"] = napalm_base.helpers.ip(item["router_id"])
-                item["local_address"] = napalm_base.helpers.convert(napalm_base.helpers.ip, item["local_address"])
-
-                peer_details.append(item)
-
-            return peer_details
-
-        def _append(bgp_dict, peer_info):
-            remote_as = peer_info["remote_as"]
-            vrf_name = peer_info["routing_table"]
-
-            if vrf_name not in bgp_dict.keys():
-                bgp_dict[vrf_name] = {}
-            if remote_as not in bgp_dict[vrf_name].keys():
-                bgp_dict[vrf_name][remote_as] = []
-
-            bgp_dict[vrf_name][remote_as].append(peer_info)
-
         _peer_ver = None
-        bgp_summary = [list(), list()]
         raw_output = [list(), list()]
         bgp_detail_info = dict()
 
@@ -1323,24 +1741,19 @@ class NetIronDriver(NetworkDriver):
             raw_output[1] = self.device.send_command(
                 'show ipv6 bgp neighbors', delay_factor=self._show_command_delay_factor)
             """
-            bgp_summary[0] = __process_bgp_summary_data__(
-                self.device.send_command("show ip bgp summary", delay_factor=self._show_command_delay_factor)
-            )
-            bgp_summary[1] = __process_bgp_summary_data__(
-                self.device.send_command("show ipv6 bgp summary", delay_factor=self._show_command_delay_factor)
+            # Send all four commands in one batch over the single shell channel
+            output = self._send_commands_batched(
+                ["show ip bgp summary", "show ipv6 bgp summary", "show ip bgp neighbors", "show ipv6 bgp neighbors"]
             )
+            summary_peers = self._process_bgp_summary(output["show ip bgp summary"])["global"]["peers"]
+            _peer_info_af[0] = self._parse_per_peer_bgp_detail(output["show ip bgp neighbors"], summary_peers, "ipv4")
 
-            # Using preset template to extract peer info
-            _peer_info_af[0] = _parse_per_peer_bgp_detail(
-                self.device.send_command("show ip bgp neighbors", delay_factor=self._show_command_delay_factor)
-            )
-            _peer_info_af[1] = _parse_per_peer_bgp_detail(
-                self.device.send_command("show ipv6 bgp neighbors", delay_factor=self._show_command_delay_factor)
-            )
+            summary_peers = self._process_bgp_summary(output["show ipv6 bgp summary"])["global"]["peers"]
+            _peer_info_af[1] = self._parse_per_peer_bgp_detail(output["show ipv6 bgp neighbors"], summary_peers, "ipv6")
 
         else:
             try:
-                _peer_ver = IPAddress(neighbor_address).version
+                _peer_ver = ipaddress.ip_address(neighbor_address).version
             except Exception as e:
                 raise e
 
@@ -1352,14 +1765,16 @@ class NetIronDriver(NetworkDriver):
                     'show ip bgp neighbors {}'.format(neighbor_address),
                     delay_factor=self._show_command_delay_factor)
                 """
-                bgp_summary[0] = __process_bgp_summary_data__(
+                summary_peers = self._process_bgp_summary(
                     self.device.send_command("show ip bgp summary", delay_factor=self._show_command_delay_factor)
-                )
-                _peer_info_af[0] = _parse_per_peer_bgp_detail(
+                )["global"]["peers"]
+                _peer_info_af[0] = self._parse_per_peer_bgp_detail(
                     self.device.send_command(
                         "show ip bgp neighbors {}".format(neighbor_address),
                         delay_factor=self._show_command_delay_factor,
-                    )
+                    ),
+                    summary_peers,
+                    "ipv4",
                 )
             else:
                 """
@@ -1367,34 +1782,21 @@ class NetIronDriver(NetworkDriver):
                     'show ipv6 bgp neighbors {}'.format(neighbor_address),
                     delay_factor=self._show_command_delay_factor)
                 """
-                bgp_summary[1] = __process_bgp_summary_data__(
+                summary_peers = self._process_bgp_summary(
                     self.device.send_command("show ipv6 bgp summary", delay_factor=self._show_command_delay_factor)
-                )
-                _peer_info_af[1] = _parse_per_peer_bgp_detail(
+                )["global"]["peers"]
+                _peer_info_af[1] = self._parse_per_peer_bgp_detail(
                     self.device.send_command(
                         "show ipv6 bgp neighbors {}".format(neighbor_address),
                         delay_factor=self._show_command_delay_factor,
-                    )
+                    ),
+                    summary_peers,
+                    "ipv6",
                 )
 
-        for i, info in enumerate(_peer_info_af):
+        for info in _peer_info_af:
             for peer_info in info:
-                _peer_remote_addr = peer_info.get("remote_address")
-
-                try:
-                    _bgp_summary = bgp_summary[i]["global"]["peers"].get(_peer_remote_addr)
-                    if _bgp_summary:
-                        peer_info["local_as"] = _bgp_summary["local_as"]
-
-                        _afi_info = _bgp_summary["address_family"].get("ipv4" if i == 0 else "ipv6")
-                        if _afi_info:
-                            peer_info["suppressed_prefix_count"] = int(_afi_info.get("filtered_prefixes", 0))
-                            peer_info["advertised_prefix_count"] = int(_afi_info.get("sent_prefixes", 0))
-                            peer_info["accepted_prefix_count"] = int(_afi_info.get("accepted_prefixes", 0))
-                except:
-                    pass
-
-                _append(bgp_detail_info, peer_info)
+                append_bgp_detail(bgp_detail_info, peer_info)
 
         return bgp_detail_info
 
@@ -1402,51 +1804,23 @@ class NetIronDriver(NetworkDriver):
         """get_interfaces_counters method."""
         cmd = "show statistics"
         lines = self.device.send_command(cmd)
-        lines = lines.split("\n")
 
         counters = {}
-        for line in lines:
-            port_block = re.match(r"\s*PORT (\S+) Counters:.*", line)
-            if port_block:
-                interface = port_block.group(1)
+        for line in iter_lines(lines):
+            # line: PORT 1/1 Counters:
+            fields = line.split(None, 3) if line.lstrip().startswith("PORT ") else ()
+            if len(fields) > 2 and fields[2].startswith("Counters:"):
+                interface = fields[1]
                 counters.setdefault(interface, {})
-            elif len(line) == 0:
+            # Counter lines all have an In column
+            elif "In" not in line:
                 continue
             else:
-                octets = re.match(r"\s+InOctets\s+(\d+)\s+OutOctets\s+(\d+)\.*", line)
-                if octets:
-                    counters[interface]["rx_octets"] = octets.group(1)
-                    counters[interface]["tx_octets"] = octets.group(2)
-                    continue
-
-                packets = re.match(r"\s+InUnicastPkts\s+(\d+)\s+OutUnicastPkts\s+(\d+)\.*", line)
-                if packets:
-                    counters[interface]["rx_unicast_packets"] = packets.group(1)
-                    counters[interface]["tx_unicast_packets"] = packets.group(2)
-                    continue
-
-                broadcast = re.match(r"\s+InBroadcastPkts\s+(\d+)\s+OutBroadcastPkts\s+(\d+)\.*", line)
-                if broadcast:
-                    counters[interface]["rx_broadcast_packets"] = broadcast.group(1)
-                    counters[interface]["tx_broadcast_packets"] = broadcast.group(2)
-                    continue
-
-                multicast = re.match(r"\s+InMulticastPkts\s+(\d+)\s+OutMulticastPkts\s+(\d+)\.*", line)
-                if multicast:
-                    counters[interface]["rx_multicast_packets"] = multicast.group(1)
-                    counters[interface]["tx_multicast_packets"] = multicast.group(2)
-                    continue
-
-                error = re.match(r"\s+InErrors\s+(\d+)\s+OutErrors\s+(\d+)\.*", line)
-                if error:
-                    counters[interface]["rx_errors"] = error.group(1)
-                    counters[interface]["tx_errors"] = error.group(2)
-                    continue
-
-                discard = re.match(r"\s+InDiscards\s+(\d+)\s+OutDiscards\s+(\d+)\.*", line)
-                if discard:
-                    counters[interface]["rx_discards"] = discard.group(1)
-                    counters[interface]["tx_discards"] = discard.group(2)
+                counter = RE_STATISTICS_COUNTER.match(line)
+                if counter:
+                    rx_key, tx_key = STATISTICS_COUNTER_KEYS[counter.group("counter")]
+                    counters[interface][rx_key] = int(counter.group("rx"))
+                    counters[interface][tx_key] = int(counter.group("tx"))
 
         return counters
 
@@ -1482,15 +1856,24 @@ class NetIronDriver(NetworkDriver):
             "cpu_detail": {},
         }
 
-        lines = self.device.send_command("show cpu-utilization average all 300 | include idle")
-        for line in lines.split("\n"):
-            r1 = re.match(r"^idle\s+.*(\d+)$", line)
-            if r1:
-                environment["cpu"][0]["%usage"] = 100 - int(r1.group(1))
-
-        _data = napalm.base.helpers.textfsm_extractor(
-            self, "show_cpu_lp", self.device.send_command("show cpu-utilization lp")
+        # Send all four commands in one batch over the single shell channel
+        output = self._send_commands_batched(
+            [
+                "show cpu-utilization average all 300 | include idle",
+                "show cpu-utilization lp",
+                "show memory",
+                "show chassis",
+            ]
         )
+
+        lines = output["show cpu-utilization average all 300 | include idle"]
+        for line in iter_lines(lines):
+            # the idle percentage is the last field of the idle line
+            fields = line.split() if line.startswith("idle") else ()
+            if len(fields) > 1 and fields[0] == "idle" and fields[-1].isdigit():
+                environment["cpu"][0]["%usage"] = 100 - int(fields[-1])
+
+        _data = textfsm_extractor(self, "show_cpu_lp", output["show cpu-utilization lp"])
         if _data:
             for d in _data:
                 _slot = d.get("slot")
@@ -1499,28 +1882,26 @@ class NetIronDriver(NetworkDriver):
                     environment["cpu_detail"]["LP{}".format(_slot)] = {"%usage": _pct}
 
         # process memory
-        _data = napalm.base.helpers.textfsm_extractor(self, "show_memory", self.device.send_command("show memory"))
+        _data = textfsm_extractor(self, "show_memory", output["show memory"])
         # print(json.dumps(_data, indent=2))
         if _data:
+            convert = napalm.base.helpers.convert
             for d in _data:
                 _name = d.get("name")
                 _module = d.get("module")
                 _state = d.get("state")
-                _avail = napalm.base.helpers.convert(int, d.get("avail_ram"), 0)
-                _total = napalm.base.helpers.convert(int, d.get("total_ram"), 0)
-                _used = _avail / _total if _avail > 0 else 0
-                _pct = d.get("avail_ram_pct")
+                _avail = convert(int, d.get("avail_ram"), 0)
+                _total = convert(int, d.get("total_ram"), 0)
+                _used = max(_total - _avail, 0)
 
                 if _name and _module:
                     environment["memory_detail"][_module] = {"used_ram": _used, "available_ram": _avail}
 
                     if "MP" in _module and _state and _state == "active":
-                        environment["memory"] = {"available_ram": _avail, "used_ram": _avail}
+                        environment["memory"] = {"available_ram": _avail, "used_ram": _used}
 
         # todo replace with 'show chassis' tpl
-        command = "show chassis"
-        lines = self.device.send_command(command)
-        _data = napalm.base.helpers.textfsm_extractor(self, "show_chassis", lines)
+        _data = textfsm_extractor(self, "show_chassis", output["show chassis"])
 
         _chassis_modules = {"TEMP": "temperature", "FAN": "fans", "POWER": "power"}
         if _data:
@@ -1582,25 +1963,20 @@ class NetIronDriver(NetworkDriver):
 
         arp_cmd = "show arp {}".format(vrf)
         output = self.device.send_command(arp_cmd)
-        output = output.split("\n")
-        output = output[7:]
 
-        for line in output:
-            fields = line.split()
-
-            if len(fields) == 6:
-                num, address, mac, typ, age, interface = fields
-                try:
-                    if age == "None":
-                        age = 0
-                    age = float(age)
-                except ValueError:
-                    logger.warn("Unable to convert age value to float: {}".format(age))
+        # Skip the 7 header lines, then match the numbered Dynamic and Static entries in a single pass over the
+        # rest of the output; 'Pending' entries are not included
+        output = output.split("\n", 7)
+        for address, mac, age, interface in RE_ARP_ENTRY.findall(output[7] if len(output) > 7 else ""):
+            try:
+                if age == "None":
+                    age = 0
+                age = float(age)
+            except ValueError:
+                logger.warning("Unable to convert age value to float: {}".format(age))
 
-                # Do not include 'Pending' entries
-                if typ == "Dynamic" or typ == "Static":
-                    entry = {"interface": interface, "mac": napalm.base.helpers.mac(mac), "ip": address, "age": age}
-                    arp_table.append(entry)
+            entry = {"interface": interface, "mac": parse_mac_address(mac), "ip": address, "age": age}
+            arp_table.append(entry)
 
         return arp_table
 
@@ -1618,9 +1994,11 @@ class NetIronDriver(NetworkDriver):
 
         """
         cli_output = dict()
-        if type(commands) is not list:
+        # Any iterable of commands will do, but a single string would be sent one character at a time
+        if isinstance(commands, str):
             raise TypeError("Please enter a valid list of commands!")
 
+        # Sent one at a time: any command may prompt for input or fail, and must not run ahead of the previous one
         for command in commands:
             output = self._send_command(command)
             if "Invalid input detected" in output:
@@ -1646,15 +2024,9 @@ class NetIronDriver(NetworkDriver):
             }
 
         """
-        _ntp_servers = {}
-
-        # as a quick implementation; call get_ntp_stats to get a list of ntp servers
-        _ntp_info = self.get_ntp_stats()
-        if _ntp_info:
-            for n in _ntp_info:
-                _ntp_servers[n.get("remote")] = {}
-
-        return _ntp_servers
+        # The servers are the remotes of the associations get_ntp_stats reports, without converting their stats
+        output = self._send_command("show ntp associations")
+        return {d["remote"]: {} for d in textfsm_extractor(self, "show_ntp_associations", output)}
 
     def get_ntp_stats(self):
         """
@@ -1692,40 +2064,26 @@ class NetIronDriver(NetworkDriver):
                 }
             ]
         """
-        ntp_stats = []
-
         command = "show ntp associations"
         output = self._send_command(command)
 
-        for line in output.splitlines():
-            # Skip first two lines and last line of command output
-            if line == "" or "address" in line or "sys.peer" in line:
-                continue
-
-            if "%NTP is not enabled" in line:
-                return []
-
-            elif len(line.split()) == 9:
-                address, ref_clock, st, when, poll, reach, delay, offset, disp = line.split()
-                address_regex = re.match(r"(\W*)([0-9.*]*)", address)
-            try:
-                ntp_stats.append(
-                    {
-                        "remote": str(address_regex.group(2)),
-                        "synchronized": ("*" in address_regex.group(1)),
-                        "referenceid": str(ref_clock),
-                        "stratum": int(st),
-                        "type": "-",
-                        "when": str(when),
-                        "hostpoll": int(poll),
-                        "reachability": int(reach),
-                        "delay": float(delay),
-                        "offset": float(offset),
-                        "jitter": float(disp),
-                    }
-                )
-            except Exception:
-                continue
+        # The template only matches complete association rows, so the numeric fields always convert
+        ntp_stats = [
+            {
+                "remote": d["remote"],
+                "synchronized": "*" in d["flags"],
+                "referenceid": d["referenceid"],
+                "stratum": int(d["stratum"]),
+                "type": "-",
+                "when": d["when"],
+                "hostpoll": int(d["hostpoll"]),
+                "reachability": int(d["reachability"]),
+                "delay": float(d["delay"]),
+                "offset": float(d["offset"]),
+                "jitter": float(d["jitter"]),
+            }
+            for d in textfsm_extractor(self, "show_ntp_associations", output)
+        ]
 
         return ntp_stats
 
@@ -1733,43 +2091,29 @@ class NetIronDriver(NetworkDriver):
         """get_mac_address_table method."""
         cmd = "show mac-address"
         lines = self.device.send_command(cmd)
-        lines = lines.split("\n")
 
-        mac_address_table = []
-        # Headers may change whether there are static entries, is MLX or is CER
-        for line in lines:
-            fields = line.split()
+        # Headers may change whether there are static entries, is MLX or is CER, so only the rows with the column
+        # layout of this family are matched, in a single pass over the output
+        entry_pattern = RE_MAC_TABLE_ENTRY_MLX if self.family == "MLX" else RE_MAC_TABLE_ENTRY_CER
+        rows = entry_pattern.findall(lines)
 
-            r1 = re.match(r"(\S+)\s+(\S+)\s+(Static|\d+)\s+(\d+).*", line)
-            if r1:
-                vlan = -1
-                age = 0
-                if self.family == "MLX":
-                    if len(fields) == 4:
-                        mac_address, port, age, vlan = fields
-                else:
-                    if len(fields) == 5:
-                        mac_address, port, age, vlan, esi = fields
-
-                is_static = bool("Static" in age)
-                mac_address = napalm.base.helpers.mac(mac_address)
-
-                entry = {
-                    "mac": mac_address,
-                    "interface": str(port),
-                    "vlan": int(vlan),
-                    "active": bool(1),
-                    "static": is_static,
-                    "moves": None,
-                    "last_move": None,
-                }
-                mac_address_table.append(entry)
-
-        return mac_address_table
+        return [
+            {
+                "mac": parse_mac_address(mac),
+                "interface": port,
+                "vlan": int(vlan),
+                "active": True,
+                "static": age == "Static",
+                "moves": None,
+                "last_move": None,
+            }
+            for mac, port, age, vlan, *_ in rows
+        ]
 
     def get_probes_config(self):
         raise NotImplementedError
 
+    @cached_output_scope
     def get_snmp_information(self, decrypt=False):
         """
         Retrieves SNMP configuration. Note this is partially implemented in that only SNMP v2c is supported. There
@@ -1803,33 +2147,35 @@ class NetIronDriver(NetworkDriver):
 
             # default values
             snmp_dict = {"chassis_id": "unknown", "community": {}, "contact": "unknown", "location": "unknown"}
-            command = "show run | include snmp-server"
-            output = self._send_command(command)
-            for line in output.splitlines():
-                fields = line.split()
-                if "snmp-server community" in line:
-                    name = fields[2]
+            # parse a running config fetched within the TTL rather than asking the device again
+            output = None if decrypt else self._cached_running_config()
+            if output is None:
+                command = "show run | include snmp-server"
+                output = self._send_command(command)
+            for setting, value in RE_SNMP_SERVER.findall(output):
+                fields = value.split()
+                if setting == "community":
+                    name = fields[0]
                     if "community" not in snmp_dict.keys():
                         snmp_dict.update({"community": {}})
                     snmp_dict["community"].update({name: {}})
                     try:
-                        snmp_dict["community"][name].update({"mode": fields[3].lower()})
+                        snmp_dict["community"][name].update({"mode": fields[1].lower()})
                     except IndexError:
                         snmp_dict["community"][name].update({"mode": "N/A"})
                     try:
-                        snmp_dict["community"][name].update({"acl": fields[4]})
+                        snmp_dict["community"][name].update({"acl": fields[2]})
                     except IndexError:
                         snmp_dict["community"][name].update({"acl": "N/A"})
-                elif "snmp-server location" in line:
-                    snmp_dict["location"] = " ".join(fields[2:])
-                elif "snmp-server contact" in line:
-                    snmp_dict["contact"] = " ".join(fields[2:])
-                elif "snmp-server chassis-id" in line:
-                    snmp_dict["chassis_id"] = " ".join(fields[2:])
-                else:
+                elif setting == "location":
+                    snmp_dict["location"] = " ".join(fields)
+                elif setting == "contact":
+                    snmp_dict["contact"] = " ".join(fields)
+                elif setting == "chassis-id":
+                    snmp_dict["chassis_id"] = " ".join(fields)
+                elif fields:
                     # add any other snmp-server configuration
-                    if len(fields) > 2:
-                        snmp_dict[fields[1]] = " ".join(fields[2:])
+                    snmp_dict[setting] = " ".join(fields)
 
         finally:
             # disable password-display before exiting
@@ -1857,10 +2203,10 @@ class NetIronDriver(NetworkDriver):
         """
         _users = {}
         _output = self._send_command("show users")
-        for l in _output.split("\n"):
+        for l in iter_lines(_output):
             _info = l.split()
 
-            if _info and len(_info) == 4 and not re.search(r"^(Username|=======)", _info[0]):
+            if len(_info) == 4 and not _info[0].startswith(("Username", "=======")):
                 _users[_info[0]] = {"password": _info[1], "sshkeys": [], "level": _info[3]}
         return _users
 
@@ -1890,8 +2236,9 @@ class NetIronDriver(NetworkDriver):
         """
         ping_dict = {}
 
-        _ip = IPAddress(destination)
-        if not _ip:
+        # Raises ValueError if not a valid IP address
+        _ip = ipaddress.ip_address(destination)
+        if _ip.is_unspecified:
             raise ValueError("destination must be a valid IP Address")
 
         if timeout < 50:
@@ -1929,10 +2276,10 @@ class NetIronDriver(NetworkDriver):
             }
 
             _probe_results = list()
-            for line in output.splitlines():
+            for line in iter_lines(output):
                 fields = line.split()
                 if "Success rate is 0" in line:
-                    sent_and_received = re.search(r"\((\d*)/(\d*)\)", fields[5])
+                    sent_and_received = RE_PING_PROBES.search(fields[5])
                     probes_sent = int(sent_and_received.groups()[0])
                     probes_received = int(sent_and_received.groups()[1])
                     ping_dict["success"]["probes_sent"] = probes_sent
@@ -1940,10 +2287,10 @@ class NetIronDriver(NetworkDriver):
                 elif "Success rate is" in line:
                     # brocade jams min/avg/max and values together as opposed to Cisco which uses spaces
                     # Success rate is 100 percent (3/3), round-trip min/avg/max=24/26/29 ms.
-                    sent_and_received = re.search(r"\((\d*)/(\d*)\)", fields[5])
+                    sent_and_received = RE_PING_PROBES.search(fields[5])
                     probes_sent = int(sent_and_received.groups()[0])
                     probes_received = int(sent_and_received.groups()[1])
-                    min_avg_max = re.search(r"(\d*)/(\d*)/(\d*)", fields[7])
+                    min_avg_max = RE_PING_MIN_AVG_MAX.search(fields[7])
                     ping_dict["success"]["probes_sent"] = probes_sent
                     ping_dict["success"]["packet_loss"] = probes_sent - probes_received
                     ping_dict["success"].update(
@@ -1968,7 +2315,7 @@ class NetIronDriver(NetworkDriver):
 
                 elif "Reply from " in line:
                     # grab the time results and append a list
-                    r = re.search(r"^Reply from .* time=(\d+)", line)
+                    r = RE_PING_REPLY.search(line)
                     if r:
                         _probe_results.append(r.groups()[0])
 
@@ -1996,8 +2343,9 @@ class NetIronDriver(NetworkDriver):
             * ip_address (str)
             * host_name (str)
         """
-        _ip = IPAddress(destination)
-        if not _ip:
+        # Raises ValueError if not a valid IP address
+        _ip = ipaddress.ip_address(destination)
+        if _ip.is_unspecified:
             raise ValueError("destination must be a valid IP Address")
 
         # perform a ping to verify if the destination will respond -- this speeds up processing -- if a
@@ -2028,46 +2376,34 @@ class NetIronDriver(NetworkDriver):
 
         logger.info(command)
 
-        # Calculation to leave enough time for traceroute to complete assumes send_command
-        # delay of .2 seconds.
-        max_loops = (5 * ttl * timeout) + 150
-        if max_loops < 500:  # Make sure max_loops isn't set artificially low
-            max_loops = 500
-        output = self.device.send_command(command, max_loops=max_loops)
+        # Allow every hop to time out, but stop reading as soon as the prompt comes back
+        read_timeout = (ttl or TRACEROUTE_TTL) * (timeout or TRACEROUTE_TIMEOUT) + 10
+        output = self.device.send_command(
+            command, expect_string=re.escape(self.device.base_prompt), read_timeout=read_timeout
+        )
 
         if "Not authorized to execute this command" in output:
             raise ValueError("Permissions Error: {0}: Not authorized to execute this command.".format(self.username))
 
         # Prepare return dict
         traceroute_dict = dict()
-        if re.search("Unrecognized host or address", output):
+        if "Unrecognized host or address" in output:
             traceroute_dict["error"] = "unknown host %s" % destination
             return traceroute_dict
         else:
             traceroute_dict["success"] = dict()
 
         results = dict()
-        # Find all hops
-        hops = re.findall(r"\n\s+[0-9]{1,3}\s+.*", output)
-        for h in hops:
-            # lets try simply splitting the string vs. regex
-            v = h.strip().split()
-            if not v or len(v) < 8:
-                logger.warn("expected at least 7 hop results: {0}:{1}".format(h, hops))
-                continue
-
-            _hop = v[0]
+        # Find all hops; lines without all three probes and a host, such as timeouts, don't match
+        for h in RE_TRACEROUTE_HOP.finditer(output):
+            _hop = h.group("hop")
             _ip_address = ""
             _host = "?"
             _p1 = _p2 = _p3 = "*"
 
-            if v[1] != "*":
-                if len(v) == 9:
-                    _ip_address = re.sub(r"[\[\]]", "", v[8])
-                _host = v[7]
-                _p1 = v[1]
-                _p2 = v[3]
-                _p3 = v[5]
+            if h.group("p1") != "*":
+                _p1, _p2, _p3, _host, _ip_address = h.group("p1", "p2", "p3", "host", "ip_address")
+                _ip_address = _ip_address or ""
 
             results[_hop] = dict()
             results[_hop]["probes"] = dict()
@@ -2078,6 +2414,7 @@ class NetIronDriver(NetworkDriver):
         traceroute_dict["success"] = results
         return traceroute_dict
 
+    @cached_output_scope
     def get_network_instances(self, name=""):
         instances = {}
 
@@ -2113,12 +2450,12 @@ class NetIronDriver(NetworkDriver):
 
         return instances if not name else instances[name]
 
+    @cached_output_scope
     def get_static_routes(self):
         routes = []
 
-        show_running_config = self.device.send_command_timing(
-            "show running-config interface", delay_factor=self._show_command_delay_factor
-        )
+        self._prefetch_show_commands("show_running_config_interface")
+        show_running_config = self.show_running_config_interface
         static_routes_detail = textfsm_extractor(self, "static_route_details", show_running_config)
 
         vrf_static_routes_details = textfsm_extractor(self, "vrf_static_route_details", show_running_config)
@@ -2132,6 +2469,7 @@ class NetIronDriver(NetworkDriver):
 
         return routes
 
+    @cached_output_scope
     def get_config(self, retrieve="all"):
         """Implementation of get_config for netiron.
 
@@ -2149,13 +2487,15 @@ class NetIronDriver(NetworkDriver):
 
         if retrieve in ("startup", "all"):
             command = "show configuration"
-            output = self.device.send_command_timing(command)
+            output = self.device.send_command(
+                command,
+                expect_string=re.escape(self.device.base_prompt),
+                read_timeout=max(self.timeout, CONFIG_READ_TIMEOUT),
+            )
             configs["startup"] = output
 
         if retrieve in ("running", "all"):
-            command = "show running-config"
-            output = self.device.send_command_timing(command)
-            configs["running"] = output
+            configs["running"] = self._get_running_config()
 
         return configs
 
@@ -2191,15 +2531,13 @@ class NetIronDriver(NetworkDriver):
         command = "show ipv6 neighbors"
         output = self._send_command(command)
 
-        ipv6_neighbors = ""
-        fields = re.split(r"^IPv6\s+Address.*Interface$", output, flags=(re.M | re.I))
-        if len(fields) == 2:
-            ipv6_neighbors = fields[1].strip()
-        for entry in ipv6_neighbors.splitlines():
+        # Match the entries after the header in place rather than copying and splitting the rest of the output
+        header = RE_IPV6_NEIGHBORS_HEADER.search(output)
+        entries = RE_IPV6_NEIGHBOR_ENTRY.findall(output, header.end()) if header else []
+        for ip, age, mac, state, interface in entries:
             # typical format of an entry in the IOS IPv6 neighbors table:
             # 2002:FFFF:233::1 0 2894.0fed.be30  REACH Fa3/1/2.233
-            ip, age, mac, state, interface = entry.split()
-            mac = "" if mac == "-" else napalm.base.helpers.mac(mac)
+            mac = "" if mac == "-" else parse_mac_address(mac)
             ip = napalm.base.helpers.ip(ip)
             ipv6_neighbors_table.append(
                 {"interface": interface, "mac": mac, "ip": ip, "age": float(age), "state": state}
@@ -2210,21 +2548,15 @@ class NetIronDriver(NetworkDriver):
     # PRIVATE METHODS #
     ###################
 
-    def _tftp_handler(self, merge_candidate):
-        """tftp handler. return merge candidate no matter what is requested."""
-
-        def _handler(fn, raddress=None, rport=None):
-            if fn == "merge_candidate":
-                return io.StringIO(merge_candidate)
-
-        return _handler
-
     def _get_ipaddress(self):
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("1.1.1.1", 1))
-        ip = s.getsockname()[0]
-        s.close()
-        return ip
+        if self._local_ipaddress:
+            return self._local_ipaddress
+
+        # Connecting a UDP socket sends nothing; it only asks the kernel which source address it would use
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("1.1.1.1", 1))
+            self._local_ipaddress = s.getsockname()[0]
+        return self._local_ipaddress
 
     @staticmethod
     def _send_command_postprocess(output):
@@ -2234,80 +2566,19 @@ class NetIronDriver(NetworkDriver):
         Remove "Load for five sec; one minute if in output"
         Remove "Time source is"
         """
-        output = re.sub(r"^Load for five secs.*$", "", output, flags=re.M)
-        output = re.sub(r"^Time source is .*$", "", output, flags=re.M)
-        return output.strip()
-
-    @staticmethod
-    def __parse_port_change__(last_str):
-        r1 = re.match(r"(\d+) days (\d+):(\d+):(\d+)", last_str)
-        if r1:
-            days = int(r1.group(1))
-            hours = int(r1.group(2))
-            mins = int(r1.group(3))
-            secs = int(r1.group(4))
-
-            return float(secs + (mins * 60) + (hours * 60 * 60) + (days * 24 * 60 * 60))
-        else:
-            return float(-1.0)
+        return RE_COMMAND_OUTPUT_NOISE.sub("", output).strip()
 
     def _delete_keys_from_dict(self, dict_del, lst_keys):
-        for k in lst_keys:
-            try:
-                del dict_del[k]
-            except KeyError:
-                pass
-        for v in dict_del.values():
-            if isinstance(v, dict):
-                self._delete_keys_from_dict(v, lst_keys)
+        # Walk the nested dicts with an explicit stack rather than recursing into each one
+        stack = [dict_del]
+        while stack:
+            d = stack.pop()
+            for k in lst_keys:
+                d.pop(k, None)
+            stack.extend(v for v in d.values() if isinstance(v, dict))
 
         return dict_del
 
-    def _get_interface_detail(self, port):
-        description = None
-        mac = None
-        if port == "mgmt1":
-            command = "show interface management1"
-        else:
-            command = "show interface ethernet {}".format(port)
-        output = self.device.send_command(command, delay_factor=self._show_command_delay_factor)
-        output = output.split("\n")
-
-        last_flap = "0.0"
-        speed = "0"
-        for line in output:
-            # Port state change is only supported from >5.9? (no support in 5.7b)
-            r0 = re.match(r"\s+Port state change time: \S+\s+\d+\s+\S+\s+\((.*) ago\)", line)
-            if r0:
-                last_flap = self.__class__.__parse_port_change__(r0.group(1))
-            r1 = re.match(r"\s+No port name", line)
-            if r1:
-                description = ""
-            r2 = re.match(r"\s+Port name is (.*)", line)
-            if r2:
-                description = r2.group(1)
-            r3 = re.match(r"\s+Hardware is \S+, address is (\S+) (.+)", line)
-            if r3:
-                mac = r3.group(1)
-            # Empty modules may not report the speed
-            # Configured fiber speed auto, configured copper speed auto
-            # actual unknown, configured fiber duplex fdx, configured copper duplex fdx, actual unknown
-            r4 = re.match(r"\s+Configured speed (\S+),.+", line)
-            if r4:
-                speed = r4.group(1)
-                if "auto" in speed:
-                    speed = -1
-                else:
-                    r = re.match(r"(\d+)([M|G])bit", speed)
-                    if r:
-                        speed = r.group(1)
-                        if r.group(2) == "M":
-                            speed = int(speed) * 1000
-                        elif r.group(2) == "G":
-                            speed = int(speed) * 1000000
-
-        return [last_flap, description, speed, mac]
-
     def _get_interface_map(self):
         """Return dict mapping ethernet port numbers to full interface name, ie
 
@@ -2317,152 +2588,238 @@ class NetIronDriver(NetworkDriver):
         }
         """
 
-        if not self.show_int or "pytest" in sys.modules:
-            self.show_int = self.device.send_command_timing(
-                "show interface", delay_factor=self._show_command_delay_factor
-            )
-        info = textfsm_extractor(self, "show_interface", self.show_int)
+        # Only the port names are needed, so they are read straight from the output rather than parsing it
+        self._prefetch_show_commands("show_int")
 
         result = {}
-        for interface in info:
-            if "ethernet" in interface["port"].lower() and "mgmt" not in interface["port"].lower():
-                ifnum = re.sub(r".*(\d+/\d+)", "\\1", interface["port"])
-                result[ifnum] = interface["port"]
+        for port in RE_SHOW_INTERFACE_ETHERNET_PORT.findall(self.show_int):
+            if "mgmt" not in port.lower():
+                ifnum = RE_INTERFACE_NUMBER.sub("\\1", port)
+                result[ifnum] = port
 
         return result
 
-    def standardize_interface_name(self, port):
-        if not self.interface_map or "pytest" in sys.modules:
+    def _update_interface_map(self):
+        """Build interface_map if it is missing, forgetting names standardized against the previous one."""
+        if self.interface_map is None:
             self.interface_map = self._get_interface_map()
+            self._standardized_names = {}
+            self._interfaces_by_number = {}
+            for name in self.interface_map.values():
+                r1 = RE_INTERFACE_SLOT_PORT.search(name)
+                if r1:
+                    self._interfaces_by_number[(int(r1.group(1)), int(r1.group(2)))] = name
+
+    @cached_output_scope
+    def standardize_interface_name(self, port):
+        self._update_interface_map()
+        return self._standardize_interface_name(port)
 
+    def _standardize_interface_name(self, port):
+        """standardize_interface_name for callers that have already brought interface_map up to date."""
         port = str(port).strip()
+        name = self._standardized_names.get(port)
+        if name is not None:
+            return name
+
+        # A single match tells a loopback, tunnel or ve name apart from a slot/port number
+        r1 = RE_INTERFACE_NAME.match(port)
+        if r1 is None:
+            # Convert mgmt1 to Ethernetmgmt1
+            name = "Ethernetmgmt1" if port in ("mgmt1", "management1") else port
+        elif r1.group("prefix"):
+            name = INTERFACE_NAME_PREFIXES[r1.group("prefix")] + r1.group("index")
+        else:
+            # Convert 1/1 or ethernet1/1 to ethernet1/1
+            name = self.interface_map[r1.group("ifnum") + port[r1.end() :]]
 
-        # Convert lbX to LoopbackX
-        port = re.sub(r"^lb(\d+)$", "Loopback\\1", port)
-        # Convert loopbackX to LoopbackX
-        port = re.sub(r"^loopback(\d+)$", "Loopback\\1", port)
-        # Convert tnX to tunnelX
-        port = re.sub(r"^tn(\d+)$", "Tunnel\\1", port)
-        # Conver gre-tnlX to TunnelX
-        port = re.sub(r"^gre-tnl(\d+)$", "Tunnel\\1", port)
-        # Convert veX to VeX
-        port = re.sub(r"^ve(\d+)$", "Ve\\1", port)
-        # Convert mgmt1 to Ethernetmgmt1
-        if port in ["mgmt1", "management1"]:
-            port = "Ethernetmgmt1"
-        # Convert 1/1 or ethernet1/1 to ethernet1/1
-        if re.match(r".*\d+/\d+", port):
-            ifnum = re.sub(r".*(\d+/\d+)", "\\1", port)
-            port = self.interface_map[ifnum]
-
-        return port
+        self._standardized_names[port] = name
+        return name
 
+    @cached_output_scope
     def get_lags(self):
+        # Callers get their own copy, so changing a result does not change the cached LAGs
+        if self.lags is not None:
+            return copy.deepcopy(self.lags)
+
         result = {}
 
-        if not self.show_running_config_lag or "pytest" in sys.modules:
-            self.show_running_config_lag = self.device.send_command_timing(
-                "show running-config lag", delay_factor=self._show_command_delay_factor
-            )
-        info = textfsm_extractor(self, "show_running_config_lag", self.show_running_config_lag)
+        info = self._parse_cached_output("show_running_config_lag", "show_running_config_lag")
         for lag in info:
             port = "lag{}".format(lag["id"])
-            result[port] = {
-                "is_up": True,
-                "is_enabled": True,
-                "description": lag["name"],
-                "last_flapped": float(-1),
-                "speed": float(0),
-                "mac_address": "",
-                "mtu": 0,
-                "children": self.interfaces_to_list(lag["ports"]),
-            }
+            result[port] = entry = LAG_INTERFACE_TEMPLATE.copy()
+            entry["description"] = lag["name"]
+            entry["children"] = self.interfaces_to_list(lag["ports"])
 
-        return result
+        self.lags = result
+        return copy.deepcopy(result)
 
+    @cached_output_scope
     def interface_list_conversion(self, ve, taggedports, untaggedports):
         interfaces = []
         if ve and ve != "NONE":
             interfaces.append("Ve{}".format(ve))
         if taggedports:
-            interfaces.extend(self.interfaces_to_list(taggedports))
+            interfaces.extend(self._iter_interfaces(taggedports))
         if untaggedports:
-            interfaces.extend(self.interfaces_to_list(untaggedports))
+            interfaces.extend(self._iter_interfaces(untaggedports))
         return interfaces
 
+    @cached_output_scope
     def interfaces_to_list(self, interfaces_string):
         """Convert string like 'ethe 2/1 ethe 2/4 to 2/5' or 'e 2/1 to 2/4' to list of interfaces"""
-        interfaces = []
+        return list(self._iter_interfaces(interfaces_string))
+
+    def _iter_interfaces(self, interfaces_string):
+        """Yield the interfaces of a string like 'ethe 2/1 ethe 2/4 to 2/5' one at a time, see interfaces_to_list."""
+        ranges = RE_PORT_RANGE.findall(interfaces_string)
+        if not ranges:
+            return
+
+        # Bring the interface map up to date once for the whole list rather than once per port
+        self._update_interface_map()
+        by_number = self._interfaces_by_number
+
+        # Individual ports like '2/1' have no end of range
+        for slot, num, end_slot, end_num in ranges:
+            if end_slot and end_slot != slot:
+                logger.warning("Skipping port range across slots: {}{} to {}{}".format(slot, num, end_slot, end_num))
+                continue
+            _slot = int(slot[:-1])
+            for n in range(int(num), int(end_num or num) + 1):
+                name = by_number.get((_slot, n))
+                if name is None:
+                    name = self._standardize_interface_name(slot + str(n))
+                yield name
+
+    def _process_bgp_summary(self, lines_summary, bgp_data=None):
+        """
+        Process BGP summary data, shared by get_bgp_neighbors and get_bgp_neighbors_detail
+        Args:
+            lines_summary (str): output of a single show ip[v6] bgp summary
+            bgp_data (dict): optional result of a previous call to add the peers to
+
+        Returns:
+            bgp_data (dict):
+        """
 
-        if "ethernet" in interfaces_string:
-            split_string = "ethernet"
-        elif "ethe" in interfaces_string:
-            split_string = "ethe"
+        if bgp_data is None:
+            bgp_data = dict()
+            bgp_data["global"] = dict()
+            bgp_data["global"]["peers"] = dict()
+
+        # The Router ID line is the header of the summary so look it up once rather than trying it on every row
+        local_as = 0
+        route_stats = {}
+        r1 = RE_BGP_SUMMARY_ROUTER_ID.search(lines_summary)
+        if r1:
+            # FIXME: Use AS numbers check: napalm.base.helpers.as_number
+            router_id = r1.group("router_id")
+            local_as = r1.group("local_as")
+            # FIXME check the router_id looks like an ipv4 address
+            # router_id = napalm.base.helpers.ip(router_id, version=4)
+            bgp_data["global"]["router_id"] = router_id
+
+        for line in iter_lines(lines_summary):
+            # Neighbor Address  AS#         State   Time          Rt:Accepted Filtered Sent     ToSend
+            # 12.12.12.12       513         ESTAB   587d7h24m    0           0        255      0
+            # NOTE: uptime is not always a single string!
+            if not line[:1].isspace() or ("." not in line and ":" not in line):
+                continue
+            r2 = RE_BGP_SUMMARY_PEER.match(line)
+            if r2:
+                peer = r2.groupdict()
+                remote_addr = parse_ip_address(peer["remote_addr"])
+
+                afi = "ipv4" if remote_addr.version == 4 else "ipv6"
+                accepted_prefixes = int(peer["accepted_prefixes"])
+                filtered_prefixes = int(peer["filtered_prefixes"])
+                bgp_data["global"]["peers"][str(remote_addr)] = {
+                    "local_as": local_as,
+                    "remote_as": peer["remote_as"],
+                    "address_family": {
+                        afi: {
+                            "received_prefixes": accepted_prefixes + filtered_prefixes,
+                            "accepted_prefixes": accepted_prefixes,
+                            "filtered_prefixes": filtered_prefixes,
+                            "sent_prefixes": int(peer["sent_prefixes"]),
+                            "to_send_prefixes": int(peer["tosend_prefixes"]),
+                        }
+                    },
+                }
+                continue
+
+            # There is a case where brocade's formatting doesn't account for overruns and numbers are displayed
+            # without a space between fields:
+            # 2607:f4e8::26             22822       ESTAB   349d16h40m    1466        1191838648268     0
+            # in this case just grab the 1st (4) fields and add the remote_addr to the _stats_error dict
+            r2 = RE_BGP_SUMMARY_PEER_OVERFLOW.match(line)
+            if r2:
+                logger.info("brocade overflow bug: line: {}".format(line))
+                logger.info(r2.group())
+                try:
+                    remote_addr = parse_ip_address(r2.group("remote_addr"))
+                    afi = "ipv4" if remote_addr.version == 4 else "ipv6"
+                    # The routes-summary of every neighbor is fetched once, not once per overflowed line
+                    if afi not in route_stats:
+                        route_stats[afi] = self.__get_bgp_route_stats__(afi)
+                    _stats = route_stats[afi].get(str(remote_addr)) or dict.fromkeys(BGP_ROUTE_STATS_FIELDS, -1)
+                    bgp_data["global"]["peers"][str(remote_addr)] = {
+                        "local_as": local_as,
+                        "remote_as": r2.group("remote_as"),
+                        "address_family": {afi: _stats},
+                    }
+                except Exception as ex:
+                    logger.warning("unable to process overflow bug line: {}".format(ex))
+
+        return bgp_data
+
+    def _parse_per_peer_bgp_detail(self, peer_output, summary_peers, afi):
+        """This function parses the raw data per peer and returns a
+        json structure per peer, merged with the peer's summary data.
+        """
+
+        peer_details = []
+
+        # Using preset template to extract peer info
+        if self.use_fast_parser:
+            _peer_info = parse_bgp_detail(peer_output)
         else:
-            split_string = "e"
-
-        sections = interfaces_string.split(split_string)
-        if "" in sections:
-            sections.remove("")  # Remove empty list items
-        for section in sections:
-            section = section.strip()  # Remove leading/trailing spaces
-
-            # Process sections like 2/4 to 2/6
-            if "to" in section:
-                start_intf, end_intf = section.split(" to ")
-                slot, num = start_intf.split("/")
-                slot, end_num = end_intf.split("/")
-                num = int(num)
-                end_num = int(end_num)
-
-                while num <= end_num:
-                    intf_name = "{}/{}".format(slot, num)
-                    interfaces.append(self.standardize_interface_name(intf_name))
-                    num += 1
-
-            # Individual ports like '2/1'
-            else:
-                interfaces.append(self.standardize_interface_name(section))
+            _peer_info = textfsm_extractor(self, "bgp_detail", peer_output)
 
-        return interfaces
+        for item in _peer_info:
+            peer_details.append(finalize_bgp_detail(item, summary_peers, afi))
 
-    def __get_bgp_route_stats__(self, remote_addr):
-        afi = "ipv4" if remote_addr.version == 4 else "ipv6"
-        command = "show ip{0} bgp neighbors {1} routes-summary".format(
-            "" if remote_addr.version == 4 else "v6", str(remote_addr)
-        )
+        return peer_details
+
+    def __get_bgp_route_stats__(self, afi):
+        """Return the route counters of every BGP neighbor of the address family afi, keyed by address."""
+        command = "show ip{0} bgp neighbors routes-summary".format("" if afi == "ipv4" else "v6")
         _lines = self.device.send_command(command, delay_factor=self._show_command_delay_factor)
-        _lines += _lines + "\n" if _lines else ""
-
-        _stats = {
-            "received_prefixes": -1,
-            "accepted_prefixes": -1,
-            "filtered_prefixes": -1,
-            "sent_prefixes": -1,
-            "to_send_prefixes": -1,
-        }
 
-        for line in _lines.splitlines():
-            r1 = re.match(
-                r"^Routes Accepted/Installed:\s*(?P<accepted_prefixes>\d+),\s+"
-                r"Filtered/Kept:\s*(?P<filtered_kept>\d+),\s+"
-                r"Filtered:\s*(?P<filtered_prefixes>\d+)",
-                line,
-            )
-            if r1:
-                _received_prefixes = int(r1.group("accepted_prefixes")) + int(r1.group("filtered_prefixes"))
-                _stats["received_prefixes"] = _received_prefixes
-                _stats["accepted_prefixes"] = r1.group("accepted_prefixes")
-                _stats["filtered_prefixes"] = r1.group("filtered_prefixes")
-
-            r2 = re.match(
-                r"^Routes Advertised:\s*(?P<sent_prefixes>\d+),\s+"
-                r"To be Sent:\s*(?P<to_be_sent>\d+),\s+"
-                r"To be Withdrawn:\s*(?P<to_be_withdrawn>\d+)",
-                line,
-            )
-            if r2:
-                _stats["sent_prefixes"] = r2.group("sent_prefixes")
-                _stats["to_send_prefixes"] = r2.group("to_be_sent")
+        route_stats = {}
+        _stats = None
+        for line in iter_lines(_lines):
+            r0 = RE_BGP_ROUTES_NEIGHBOR.search(line) if "IP Address:" in line else None
+            if r0:
+                _stats = dict.fromkeys(BGP_ROUTE_STATS_FIELDS, -1)
+                route_stats[str(parse_ip_address(r0.group("remote_addr")))] = _stats
+                continue
+            if _stats is None:
+                continue
+
+            # Routes Accepted/Installed:1466, Filtered/Kept:0, Filtered:11918
+            # Routes Advertised:3, To be Sent:0, To be Withdrawn:0
+            if line.startswith(("Routes Accepted/Installed:", "Routes Advertised:")):
+                counters = parse_route_counters(line)
+                if counters is None or len(counters) < 3:
+                    continue
+                if line.startswith("Routes Accepted"):
+                    _stats["received_prefixes"] = counters[0] + counters[2]
+                    _stats["accepted_prefixes"] = counters[0]
+                    _stats["filtered_prefixes"] = counters[2]
+                else:
+                    _stats["sent_prefixes"] = counters[0]
+                    _stats["to_send_prefixes"] = counters[1]
 
-        return {afi: _stats}
+        return route_stats
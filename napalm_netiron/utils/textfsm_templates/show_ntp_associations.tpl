@@ -0,0 +1,15 @@
+Value FLAGS (\W*)
+Value REMOTE ([0-9.*]+)
+Value REFERENCEID (\S+)
+Value STRATUM (\d+)
+Value WHEN (\S+)
+Value HOSTPOLL (\d+)
+Value REACHABILITY (\d+)
+Value DELAY (-?[\d.]+)
+Value OFFSET (-?[\d.]+)
+Value JITTER (-?[\d.]+)
+
+Start
+  ^\s*${FLAGS}${REMOTE}\s+${REFERENCEID}\s+${STRATUM}\s+${WHEN}\s+${HOSTPOLL}\s+${REACHABILITY}\s+${DELAY}\s+${OFFSET}\s+${JITTER}\s*$$ -> Record
+
+EOF
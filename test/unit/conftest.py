@@ -32,6 +32,8 @@ class PatchedNetIronDriver(NetIronDriver):
     """Patched Netiron Driver."""
 
     def __init__(self, hostname, username, password, timeout=60, optional_args=None):
+        # Each test case replays different mocked output, so never reuse it between getters
+        optional_args = dict(optional_args or {}, cache_show_output=False)
         super().__init__(hostname, username, password, timeout, **optional_args)
         self.patched_attrs = ["device"]
         self.device = FakeNetironDevice()
@@ -51,6 +53,7 @@ class FakeNetironDevice(BaseTestDouble):
 
     def __init__(self):
         self.base_prompt = "SSH@SWITCH1"
+        self._channel = ""
 
     def send_command(self, command, **kwargs):
         filename = "{}.text".format(self.sanitize_text(command))
@@ -60,3 +63,11 @@ class FakeNetironDevice(BaseTestDouble):
 
     def send_command_timing(self, command, **kwargs):
         return self.send_command(command, **kwargs)
+
+    def write_channel(self, out_data):
+        for command in out_data.splitlines():
+            self._channel += "{}\r\n{}\r\n{}#".format(command, self.send_command(command), self.base_prompt)
+
+    def read_channel(self):
+        output, self._channel = self._channel, ""
+        return output
@@ -15,9 +15,6 @@ class TestGetter(BaseTestGetters):
         return True
 
     # Unsupported functions
-    def test_get_interfaces_counters(self):
-        return True
-
     def test_get_environment(self):
         return True
 
@@ -27,12 +24,6 @@ class TestGetter(BaseTestGetters):
     def test_get_ntp_peers(self):
         return True
 
-    def test_get_ntp_servers(self):
-        return True
-
-    def test_get_ntp_stats(self):
-        return True
-
     def test_get_users(self):
         return True
 
@@ -60,17 +51,15 @@ class TestGetter(BaseTestGetters):
     def test_get_route_to_longer(self):
         return True
 
-    def test_get_snmp_information(self):
+    def test_ping(self):
         return True
 
-    def test_ping(self):
+    def test_get_bgp_neighbors(self):
         return True
 
+    # moves/last_move and traceroute rtt do not have the napalm model types yet, these are checked by test_parsers
     def test_traceroute(self):
         return True
 
     def test_get_mac_address_table(self):
         return True
-
-    def test_get_bgp_neighbors(self):
-        return True
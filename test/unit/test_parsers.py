@@ -0,0 +1,46 @@
+"""Tests for the regex parsers used in place of TextFSM templates."""
+
+import json
+import os
+
+import pytest
+from napalm.base.helpers import textfsm_extractor
+
+from conftest import PatchedNetIronDriver
+from napalm_netiron import NetIronDriver
+from napalm_netiron.netiron import parse_bgp_detail
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Netiron")
+MOCKED_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mocked_data")
+
+
+@pytest.mark.parametrize("sample", ["show_ip_bgp_neighbors.text", "show_ipv6_bgp_neighbors.text"])
+def test_parse_bgp_detail_matches_template(sample):
+    """parse_bgp_detail must return the same records as the bgp_detail template."""
+    with open(os.path.join(SAMPLES_DIR, sample)) as f:
+        raw_text = f.read()
+
+    device = NetIronDriver("switch1", "user", "password")
+    expected = textfsm_extractor(device, "bgp_detail", raw_text)
+
+    assert expected
+    assert parse_bgp_detail(raw_text) == expected
+
+
+@pytest.mark.parametrize(
+    "test_name,method,args",
+    [
+        ("test_get_mac_address_table", "get_mac_address_table", ()),
+        ("test_traceroute", "traceroute", ("8.8.8.8",)),
+    ],
+)
+def test_getter_matches_mocked_data(test_name, method, args):
+    """Getters skipped by the napalm getter tests must still return their mocked expected_result."""
+    device = PatchedNetIronDriver("switch1", "user", "password")
+    device.device.current_test = test_name
+    device.device.current_test_case = "normal"
+
+    with open(os.path.join(MOCKED_DATA_DIR, test_name, "normal", "expected_result.json")) as f:
+        expected = json.load(f)
+
+    assert json.loads(json.dumps(getattr(device, method)(*args))) == expected